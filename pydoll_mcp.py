@@ -103,15 +103,25 @@ Environment Independent: Automatically detects PyDoll installation
 
 import asyncio
 import base64
+import contextvars
+import fnmatch
+import functools
 import json
 import logging
+import logging.handlers
+import operator
 import os
+import queue
+import re
 import sys
 import tempfile
+import threading
 import traceback
-from contextlib import asynccontextmanager
+import urllib.parse
+from collections import OrderedDict, deque
+from itertools import count, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, List, NamedTuple, Optional, Pattern, Set, Tuple, Callable
 
 # Auto-detect PyDoll installation and add to path
 def setup_pydoll_path():
@@ -178,6 +188,23 @@ import time
 import platform
 from datetime import datetime
 
+# Optional C JSON codec for the JSON-RPC stream and large event/network logs
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional libuv event loop; uvloop does not support Windows
+uvloop = None
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+
+# Both decoders take the raw bytes read from stdin and raise json.JSONDecodeError subclasses
+json_loads = orjson.loads if orjson is not None else json.loads
+
 sys.stderr = os.fdopen(sys.stderr.fileno(), 'w', 1)
 
 # Now import PyDoll
@@ -188,7 +215,15 @@ try:
     from pydoll.exceptions import *
     from pydoll.protocol.network.types import ErrorReason
     from pydoll.protocol.fetch.types import RequestStage, HeaderEntry
-    from pydoll.commands import RuntimeCommands
+    from pydoll.commands import (
+        BrowserCommands,
+        InputCommands,
+        NetworkCommands,
+        PageCommands,
+        RuntimeCommands,
+    )
+    from pydoll.protocol.browser.methods import DownloadBehavior
+    from pydoll.protocol.input.types import KeyEventType, MouseButton, MouseEventType
     from pydoll.elements.web_element import WebElement
 except ImportError as e:
     print(f"ERROR: Failed to import PyDoll: {e}", file=sys.stderr, flush=True)
@@ -239,6 +274,17 @@ async def get_shadow_root_patched(self) -> Optional['WebElement']:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cloudflare bypass diagnostics are chatty, so hand them to a background thread
+# through a queue - the event loop never blocks on the stderr write
+cloudflare_log_queue = queue.Queue(-1)
+cloudflare_logger = logging.getLogger(f"{__name__}.cloudflare")
+cloudflare_logger.addHandler(logging.handlers.QueueHandler(cloudflare_log_queue))
+cloudflare_logger.propagate = False
+_cloudflare_log_handler = logging.StreamHandler()
+_cloudflare_log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+# Started and stopped by run_server, so importing the module does not spawn the thread
+cloudflare_log_listener = logging.handlers.QueueListener(cloudflare_log_queue, _cloudflare_log_handler)
+
 # Apply the monkey patch
 WebElement.get_shadow_root = get_shadow_root_patched
 logger.info("Applied Shadow DOM monkey patch to PyDoll WebElement")
@@ -599,13 +645,50 @@ def auto_update_check():
 
 # JSON-RPC server configuration
 
+class EventCallback(NamedTuple):
+    """A callback registered through register_event_callback"""
+    pydoll_callback_id: Any
+    event_type: str
+    filter_pattern: Optional[str]
+    pattern_re: Optional[Pattern]
+
 # Global session management
 BROWSER_SESSIONS: Dict[str, Chrome] = {}
 TAB_SESSIONS: Dict[str, Any] = {}
-ELEMENT_CACHE: Dict[str, Any] = {}
-EVENT_CALLBACKS: Dict[str, Dict[str, Any]] = {}
-EVENT_LOGS: Dict[str, List[Dict]] = {}
-NETWORK_LOGS: Dict[str, List[Any]] = {}
+ELEMENT_CACHE: "OrderedDict[str, Any]" = OrderedDict()
+EVENT_CALLBACKS: Dict[str, Dict[str, EventCallback]] = {}
+EVENT_LOGS: Dict[str, "deque[Dict]"] = {}
+NETWORK_LOGS: Dict[str, "deque[Any]"] = {}
+# Message of the most recent dialog seen by a registered dialog-opening callback, per tab
+LAST_DIALOG: Dict[str, str] = {}
+
+# Per-tab log ring size; the oldest entries drop off once a busy page fills it
+MAX_LOG_ENTRIES = 10_000
+
+def _new_log() -> deque:
+    return deque(maxlen=MAX_LOG_ENTRIES)
+
+# Ownership indexes so teardown doesn't have to scan every tab/element
+SESSION_TABS: Dict[str, Set[str]] = {}
+TAB_ELEMENTS: Dict[str, Set[str]] = {}
+ELEMENT_TO_TAB: Dict[str, str] = {}
+
+# Last suffix handed out per element ID when find_element had to rename a duplicate
+_ID_COUNTERS: Dict[str, int] = {}
+
+# Tab used for page-level input when no tab is given (last created, navigated or focused)
+ACTIVE_TAB_ID: Optional[str] = None
+
+# Arrival number of the request being served (set per task by main_async), and that of
+# the request that last set ACTIVE_TAB_ID
+REQUEST_SEQUENCE: contextvars.ContextVar[int] = contextvars.ContextVar("REQUEST_SEQUENCE", default=0)
+_ACTIVE_TAB_SEQUENCE = 0
+
+# Element IDs claimed by find_element calls still waiting on the browser
+_PENDING_ELEMENT_IDS: Set[str] = set()
+
+# ELEMENT_CACHE is kept in least-recently-used order and trimmed past this size
+MAX_CACHED_ELEMENTS = 10_000
 
 # Default configuration - environment independent
 DEFAULT_CHROME_PATHS = [
@@ -647,11 +730,190 @@ def find_chrome_binary():
     return DEFAULT_CHROME_PATHS[0]  # Fallback
 
 DEFAULT_CHROME_PATH = find_chrome_binary()
+
+# Written to stderr once at startup
+STARTUP_BANNER = (
+    f"PyDoll MCP Server v{__version__} - Complete JSON-RPC Implementation\n"
+    f"Using Chrome at: {DEFAULT_CHROME_PATH}\n"
+    "Server ready for JSON-RPC requests...\n"
+)
+
 DISPLAY = os.getenv('DISPLAY', ':99')
 
+# Override attachShadow to force open mode for better automation access
+SHADOW_DOM_OVERRIDE_SCRIPT = """
+    if (typeof Element !== 'undefined' && Element.prototype.attachShadow) {
+        Element.prototype._originalAttachShadow = Element.prototype.attachShadow;
+        Element.prototype.attachShadow = function(options) {
+            // Always use open mode for automation compatibility
+            return this._originalAttachShadow.call(this, { mode: "open" });
+        };
+    }
+"""
+
+SHADOW_DOM_OVERRIDE_COMMAND = {
+    "method": "Page.addScriptToEvaluateOnNewDocument",
+    "params": {"source": SHADOW_DOM_OVERRIDE_SCRIPT}
+}
+
+NAV_HISTORY_COMMAND = PageCommands.get_navigation_history()
+
+# Per-tab navigation history, only trusted across consecutive history commands.
+# Any other tool call may navigate, so it drops the cache (see handle_tool_call_async).
+NAV_HISTORY_CACHE: Dict[str, Dict[str, Any]] = {}
+NAV_HISTORY_TOOLS = {"go_back", "go_forward"}
+
+# Per-tab title/url/source: key -> (monotonic timestamp, value). The page's own scripts
+# can change any of them, so entries only live for PAGE_STATE_TTL; any non-read tool
+# call drops them sooner.
+PAGE_STATE_CACHE: Dict[str, Dict[str, tuple]] = {}
+PAGE_STATE_TOOLS = {"get_page_title", "get_page_url", "get_page_source", "get_session_info"}
+PAGE_STATE_TTL = 0.1
+
+# Computes every element state flag in one Runtime.callFunctionOn; mirrors PyDoll's
+# ELEMENT_VISIBLE / ELEMENT_ON_TOP / ELEMENT_INTERACTIVE scripts
+ELEMENT_STATE_SCRIPT = """
+    function() {
+        const style = window.getComputedStyle(this);
+        const rect = this.getBoundingClientRect();
+        const visible = rect.width > 0 && rect.height > 0
+            && style.visibility !== 'hidden' && style.display !== 'none';
+        const hit = document.elementFromPoint(rect.x + rect.width / 2, rect.y + rect.height / 2);
+        const onTop = !!hit && (hit === this || this.contains(hit));
+        const enabled = !this.disabled;
+        const selected = !!(this.checked || this.selected);
+        return {
+            visible: visible,
+            enabled: enabled,
+            selected: selected,
+            onTop: onTop,
+            interactable: visible && onTop && enabled && style.pointerEvents !== 'none'
+        };
+    }
+"""
+
+# element_id -> (monotonic timestamp, state flags); short-lived so back-to-back checks share one call
+ELEMENT_STATE_CACHE: Dict[str, tuple] = {}
+# element_id -> (monotonic timestamp, outerHTML); inner HTML is derived from the same snapshot
+ELEMENT_HTML_CACHE: Dict[str, tuple] = {}
+# Clicks, typing and other actions can change any element on the tab, so every other
+# tool call drops the tab's entries from both caches
+ELEMENT_STATE_TOOLS = {
+    "get_element_state", "is_element_visible", "is_element_enabled", "is_element_selected",
+    "is_element_on_top", "is_element_interactable", "get_element_html",
+}
+ELEMENT_STATE_TTL = 0.1
+
+# Selector type -> JS expression for the first match, used by wait_for_element's observer
+WAIT_FOR_SELECTOR_JS = {
+    "css": "document.querySelector(%s)",
+    "xpath": "document.evaluate(%s, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue",
+    "id": "document.getElementById(%s)",
+    "name": "document.getElementsByName(%s)[0]",
+    "tag": "document.getElementsByTagName(%s)[0]",
+    "class": "document.getElementsByClassName(%s)[0]",
+}
+
+# Resolves true on match, false on timeout, null when MutationObserver is unavailable
+WAIT_FOR_SELECTOR_SCRIPT = """
+    new Promise(resolve => {
+        const find = () => %s;
+        if (find()) return resolve(true);
+        if (typeof MutationObserver === 'undefined') return resolve(null);
+        const observer = new MutationObserver(() => {
+            if (find()) { observer.disconnect(); resolve(true); }
+        });
+        observer.observe(document, {childList: true, subtree: true, attributes: true});
+        setTimeout(() => { observer.disconnect(); resolve(false); }, %d);
+    })
+"""
+
+# Property paths get_element_property can read directly (e.g. "value", "style.display")
+JS_PROPERTY_PATH = re.compile(r"^[A-Za-z_$][\w$]*(\.[A-Za-z_$][\w$]*)*$")
+
+# Splits outerHTML into opening tag, inner HTML and matching closing tag
+OUTER_HTML_TAGS = re.compile(r"^<([\w:-]+)(?:[^>\"']|\"[^\"]*\"|'[^']*')*>(.*)</\1\s*>$", re.DOTALL)
+
+# Resolves {value} once the wrapped function returns truthy, or {timedOut: true} at the deadline
+WAIT_FOR_FUNCTION_SCRIPT = """
+    new Promise(resolve => {
+        const check = function() { %s };
+        const args = %s;
+        const deadline = Date.now() + %d;
+        const tick = () => {
+            try {
+                const value = check.apply(null, args);
+                if (value) return resolve({value: value});
+            } catch (e) {}
+            if (Date.now() >= deadline) return resolve({timedOut: true});
+            setTimeout(tick, %d);
+        };
+        tick();
+    })
+"""
+
+# Turnstile fills this hidden input with its token once the challenge is solved
+TURNSTILE_SOLVED_CHECK = "return document.querySelector('input[name=\"cf-turnstile-response\"]')?.value;"
+
+# Any return statement in a user script, meaning it is a function body rather than an expression
+JS_RETURN_STATEMENT = re.compile(r"(?:^|[;{}\n])\s*return\b")
+
+# Scripts that already start with a return statement (anchored, so only the head is scanned)
+SCRIPT_RETURN_PREFIX = re.compile(r"\s*return\b")
+
+# Script errors that mean a property was missing, so an attribute read may still succeed
+MISSING_PROPERTY_ERRORS = ("undefined", "is not defined", "is not a function")
+
+# Bytes requested per IO.read when streaming a PDF to disk
+PDF_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Base64 bodies larger than this are decoded in a worker thread instead of on the event loop
+THREAD_DECODE_THRESHOLD = 64 * 1024
+
+SUPPORTED_HTTP_METHODS = {"GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH"}
+
+# Number of MOUSE_MOVED events dispatched between press and release in drag_and_drop
+DRAG_MOVE_STEPS = 4
+
+# fail_request reason names (upper-cased, underscores stripped) -> PyDoll ErrorReason
+ERROR_REASON_MAP = {
+    "FAILED": ErrorReason.FAILED,
+    "ABORTED": ErrorReason.ABORTED,
+    "TIMEDOUT": ErrorReason.TIMED_OUT,
+    "TIMEOUT": ErrorReason.TIMED_OUT,
+    "ACCESSDENIED": ErrorReason.ACCESS_DENIED,
+    "CONNECTIONCLOSED": ErrorReason.CONNECTION_CLOSED,
+    "CONNECTIONRESET": ErrorReason.CONNECTION_RESET,
+    "CONNECTIONREFUSED": ErrorReason.CONNECTION_REFUSED,
+    "CONNECTIONABORTED": ErrorReason.CONNECTION_ABORTED,
+    "CONNECTIONFAILED": ErrorReason.CONNECTION_FAILED,
+    "NAMENOTRESOLVED": ErrorReason.NAME_NOT_RESOLVED,
+}
+
+# Selector type -> PyDoll lookup; extra kwargs (timeout, find_all, raise_exc) pass through
+SELECTOR_DISPATCH = {
+    "css": lambda tab, value, **kwargs: tab.query(value, **kwargs),
+    "xpath": lambda tab, value, **kwargs: tab.query(value, **kwargs),
+    "id": lambda tab, value, **kwargs: tab.find(id=value, **kwargs),
+    "name": lambda tab, value, **kwargs: tab.find(name=value, **kwargs),
+    "tag": lambda tab, value, **kwargs: tab.find(tag_name=value, **kwargs),
+    "class": lambda tab, value, **kwargs: tab.find(class_name=value, **kwargs),
+}
+
+def encode_response(response: Dict[str, Any]) -> bytes:
+    """Serialise a JSON-RPC response, using orjson when installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(response)
+        except TypeError:
+            # orjson rejects a few things json accepts (non-str keys, >64-bit ints)
+            pass
+    return json.dumps(response).encode()
+
 def send_response(response: Dict[str, Any]):
-    """Send a JSON-RPC response"""
-    print(json.dumps(response), flush=True)
+    """Send a JSON-RPC response as one line, with a single write and flush"""
+    sys.stdout.buffer.write(encode_response(response) + b"\n")
+    sys.stdout.buffer.flush()
 
 def create_success_response(text: str) -> Dict[str, Any]:
     """Create a success response"""
@@ -665,6 +927,12 @@ def create_error_response(text: str) -> Dict[str, Any]:
         "content": [{"type": "text", "text": f"Error: {str(text)}"}]
     }
 
+def create_exception_response(prefix: str, error: BaseException) -> Dict[str, Any]:
+    """Create an error response for a caught exception, tagged with the exception type"""
+    response = create_error_response(f"{prefix}: {error}")
+    response["errorType"] = type(error).__name__
+    return response
+
 def create_success_response_with_image(base64_data: str, mime_type: str) -> Dict[str, Any]:
     """Create a success response with image data"""
     return {
@@ -677,10 +945,21 @@ def create_success_response_with_image(base64_data: str, mime_type: str) -> Dict
         ]
     }
 
-def create_json_response(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a JSON data response"""
+# Logs and session listings are emitted compactly; set PYDOLL_MCP_PRETTY_JSON=1 to indent them
+PRETTY_JSON = os.getenv("PYDOLL_MCP_PRETTY_JSON") == "1"
+
+def dumps_json(data: Any) -> str:
+    """Serialise tool output as JSON, using orjson when installed and stringifying unknown types"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if PRETTY_JSON else None, default=str).decode()
+    if PRETTY_JSON:
+        return json.dumps(data, indent=2, default=str)
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+def create_json_response(data: Any) -> Dict[str, Any]:
+    """Create a JSON data response, encoding the data once with dumps_json"""
     return {
-        "content": [{"type": "text", "text": json.dumps(data, indent=2)}]
+        "content": [{"type": "text", "text": dumps_json(data)}]
     }
 
 # Helper functions
@@ -692,9 +971,115 @@ def get_tab_session(tab_id: str):
     """Get tab session by ID"""
     return TAB_SESSIONS.get(tab_id)
 
+def require_tab(tab_id: str):
+    """Get tab session by ID, raising ValueError if it doesn't exist"""
+    tab = TAB_SESSIONS.get(tab_id)
+    if tab is None:
+        raise ValueError(f"Tab '{tab_id}' not found")
+    return tab
+
+def set_active_tab(tab_id: str):
+    """Record the tab that page-level input should target"""
+    global ACTIVE_TAB_ID, _ACTIVE_TAB_SEQUENCE
+    # Requests on different tabs can finish out of order; the latest to arrive wins
+    sequence = REQUEST_SEQUENCE.get()
+    if sequence < _ACTIVE_TAB_SEQUENCE:
+        return
+    ACTIVE_TAB_ID = tab_id
+    _ACTIVE_TAB_SEQUENCE = sequence
+
 def get_element(element_id: str):
     """Get element by ID"""
-    return ELEMENT_CACHE.get(element_id)
+    element = ELEMENT_CACHE.get(element_id)
+    if element is not None:
+        ELEMENT_CACHE.move_to_end(element_id)
+    return element
+
+def _cache_set(element_id: str, element: Any, tab_id: Optional[str] = None):
+    """Store an element as most recently used, evicting the oldest past MAX_CACHED_ELEMENTS"""
+    ELEMENT_CACHE[element_id] = element
+    ELEMENT_CACHE.move_to_end(element_id)
+    ELEMENT_STATE_CACHE.pop(element_id, None)
+    ELEMENT_HTML_CACHE.pop(element_id, None)
+    if tab_id is not None:
+        ELEMENT_TO_TAB[element_id] = tab_id
+        TAB_ELEMENTS.setdefault(tab_id, set()).add(element_id)
+    while len(ELEMENT_CACHE) > MAX_CACHED_ELEMENTS:
+        # Evict the least recently used element along with its index entries
+        _forget_element(next(iter(ELEMENT_CACHE)))
+
+def _script_value(response: Dict[str, Any]) -> Any:
+    """Extract the returned value from a Runtime.evaluate / callFunctionOn response"""
+    return response.get('result', {}).get('result', {}).get('value')
+
+async def _evaluate_promise(tab, expression: str, timeout: float) -> Any:
+    """Evaluate an expression in the page, wait for the promise it returns and give back its value"""
+    response = await tab._execute_command(
+        RuntimeCommands.evaluate(expression=expression, await_promise=True, return_by_value=True),
+        timeout=int(timeout) + 5
+    )
+    return _script_value(response)
+
+_MISSING = object()
+
+def _unwrap_cdp_value(result: Any) -> Any:
+    """Pull the value out of a script result, whether it is an object, a CDP dict or already a value"""
+    inner = getattr(result, 'result', _MISSING)
+    if inner is not _MISSING:
+        return getattr(inner, 'value', inner)
+    if isinstance(result, dict) and 'result' in result:
+        inner = result['result']
+        if isinstance(inner, dict) and 'value' not in inner and isinstance(inner.get('result'), dict):
+            # A full Runtime.evaluate response nests the RemoteObject one level deeper
+            inner = inner['result']
+        return inner.get('value', inner) if isinstance(inner, dict) else inner
+    return result
+
+def _format_script_result(result: Any) -> str:
+    """Render a script result as text: JSON for objects/arrays instead of Python repr"""
+    if result is None:
+        return "null"
+    if isinstance(result, (dict, list)):
+        return json.dumps(result, default=str)
+    return str(result)
+
+def _forget_element(element_id: str):
+    """Drop an element from the cache and its ownership indexes"""
+    ELEMENT_CACHE.pop(element_id, None)
+    ELEMENT_STATE_CACHE.pop(element_id, None)
+    ELEMENT_HTML_CACHE.pop(element_id, None)
+    tab_id = ELEMENT_TO_TAB.pop(element_id, None)
+    if tab_id is not None:
+        TAB_ELEMENTS.get(tab_id, set()).discard(element_id)
+
+def _forget_tab_elements(tab_id: str) -> int:
+    """Drop every cached element owned by a tab, returning how many there were"""
+    element_ids = TAB_ELEMENTS.pop(tab_id, set())
+    for element_id in element_ids:
+        ELEMENT_CACHE.pop(element_id, None)
+        ELEMENT_STATE_CACHE.pop(element_id, None)
+        ELEMENT_HTML_CACHE.pop(element_id, None)
+        ELEMENT_TO_TAB.pop(element_id, None)
+    return len(element_ids)
+
+@functools.lru_cache(maxsize=256)
+def _resolve_key(key: str):
+    """Convert a key name to a PyDoll Key enum member, falling back to the raw string"""
+    key_upper = key.upper()
+    return getattr(Key, key_upper) if hasattr(Key, key_upper) else key
+
+@functools.lru_cache(maxsize=64)
+def _resolve_error_reason(reason: str):
+    """Map a user-supplied failure reason to an ErrorReason, defaulting to FAILED"""
+    return ERROR_REASON_MAP.get(reason.upper().replace("_", ""), ErrorReason.FAILED)
+
+@functools.lru_cache(maxsize=256)
+def _cached_header_entries(pairs: Tuple[Tuple[str, str], ...]) -> Tuple[HeaderEntry, ...]:
+    return tuple(HeaderEntry(name=name, value=value) for name, value in pairs)
+
+def _header_entries(headers: List[Dict]) -> List[HeaderEntry]:
+    """Build Fetch header entries, reusing them for header sets seen before (PyDoll only serialises them)"""
+    return list(_cached_header_entries(tuple((h["name"], h["value"]) for h in headers)))
 
 
 def handle_initialize(request_id: Any) -> Dict[str, Any]:
@@ -1031,9 +1416,10 @@ def handle_tools_list(request_id: Any) -> Dict[str, Any]:
                         "type": "object",
                         "properties": {
                             "element_id": {"type": "string", "description": "Element identifier"},
-                            "property_name": {"type": "string", "description": "Name of the property to get"}
+                            "property_name": {"type": "string", "description": "Name of the property to get"},
+                            "property_names": {"type": "array", "items": {"type": "string"}, "description": "Several property names to read in one call; returns a JSON object keyed by name"}
                         },
-                        "required": ["element_id", "property_name"]
+                        "required": ["element_id"]
                 }
         },
         {
@@ -1124,6 +1510,17 @@ def handle_tools_list(request_id: Any) -> Dict[str, Any]:
                         "required": ["element_id"]
                 }
         },
+        {
+                "name": "get_element_state",
+                "description": "Get visible, enabled, selected, on-top and interactable flags of an element in one call",
+                "inputSchema": {
+                        "type": "object",
+                        "properties": {
+                            "element_id": {"type": "string", "description": "Element identifier"}
+                        },
+                        "required": ["element_id"]
+                }
+        },
         {
                 "name": "get_parent_element",
                 "description": "Get parent element of specified element",
@@ -1247,7 +1644,8 @@ def handle_tools_list(request_id: Any) -> Dict[str, Any]:
                 "inputSchema": {
                         "type": "object",
                         "properties": {
-                            "tab_id": {"type": "string", "description": "Tab identifier"}
+                            "tab_id": {"type": "string", "description": "Tab identifier"},
+                            "max_chars": {"type": "integer", "description": "Maximum number of HTML characters to return", "default": 20000}
                         },
                         "required": ["tab_id"]
                 }
@@ -1327,6 +1725,7 @@ def handle_tools_list(request_id: Any) -> Dict[str, Any]:
                         "properties": {
                             "tab_id": {"type": "string", "description": "Tab identifier"},
                             "name": {"type": "string", "description": "Cookie name (optional)"},
+                            "names": {"type": "array", "items": {"type": "string"}, "description": "Several cookie names to delete in one call (optional)"},
                             "url": {"type": "string", "description": "Cookie URL (optional)"},
                             "domain": {"type": "string", "description": "Cookie domain (optional)"},
                             "path": {"type": "string", "description": "Cookie path (optional)"}
@@ -1359,6 +1758,20 @@ def handle_tools_list(request_id: Any) -> Dict[str, Any]:
                         "required": ["tab_id", "url"]
                 }
         },
+        {
+                "name": "download_files",
+                "description": "Download several URLs concurrently",
+                "inputSchema": {
+                        "type": "object",
+                        "properties": {
+                            "tab_id": {"type": "string", "description": "Tab identifier"},
+                            "urls": {"type": "array", "items": {"type": "string"}, "description": "URLs to download"},
+                            "directory": {"type": "string", "description": "Directory to save the files in (default: system temp dir)"},
+                            "concurrency": {"type": "integer", "description": "Maximum downloads in flight at once (default: 4)"}
+                        },
+                        "required": ["tab_id", "urls"]
+                }
+        },
         {
                 "name": "expect_file_chooser",
                 "description": "Handle file chooser dialogs with automatic file selection",
@@ -1529,7 +1942,7 @@ def handle_tools_list(request_id: Any) -> Dict[str, Any]:
                             "tab_id": {"type": "string", "description": "Tab identifier"},
                             "callback_id": {"type": "string", "description": "Unique callback identifier"},
                             "event_type": {"type": "string", "description": "Event type to listen for"},
-                            "filter_pattern": {"type": "string", "description": "Optional filter pattern"}
+                            "filter_pattern": {"type": "string", "description": "Optional URL glob (e.g. '*.json'); events with a URL that doesn't match are not logged"}
                         },
                         "required": ["tab_id", "callback_id", "event_type"]
                 }
@@ -1610,7 +2023,7 @@ def handle_tools_list(request_id: Any) -> Dict[str, Any]:
                             "response_code": {"type": "integer", "description": "HTTP response code", "default": 200},
                             "response_headers": {"type": "array", "items": {"type": "object"}, "description": "Response headers (optional)"},
                             "body": {"type": "string", "description": "Response body (optional)"},
-                            "binary_body": {"type": "string", "description": "Binary response body (optional)"}
+                            "binary_body": {"type": "string", "description": "Base64-encoded binary response body (optional)"}
                         },
                         "required": ["tab_id", "request_id"]
                 }
@@ -1715,22 +2128,61 @@ SERVER_LOOP = None
 
 # TOOL_HANDLERS will be defined after function definitions
 
+async def run_with_timeout(coro, timeout: float):
+    """Await a coroutine with a deadline, raising asyncio.TimeoutError when it passes"""
+    if hasattr(asyncio, "timeout"):
+        # Python 3.11+: arms a timer on the current task instead of wrapping the call in a new one
+        async with asyncio.timeout(timeout):
+            return await coro
+    return await asyncio.wait_for(coro, timeout=timeout)
+
+def _invalidate_page_caches(tool_name: str, arguments: Dict[str, Any]):
+    """Drop the cached history, page state and element state a tool call may make stale
+
+    Only the entries of the tab the call acts on are dropped, so reads running
+    concurrently on other tabs keep their caches.
+    """
+    tab_id = arguments.get("tab_id")
+    if tab_id is None and arguments.get("element_id") is not None:
+        tab_id = ELEMENT_TO_TAB.get(arguments["element_id"])
+    
+    if tab_id is None:
+        if tool_name not in NAV_HISTORY_TOOLS:
+            NAV_HISTORY_CACHE.clear()
+        if tool_name not in PAGE_STATE_TOOLS:
+            PAGE_STATE_CACHE.clear()
+        if tool_name not in ELEMENT_STATE_TOOLS:
+            ELEMENT_STATE_CACHE.clear()
+            ELEMENT_HTML_CACHE.clear()
+        return
+    
+    if tool_name not in NAV_HISTORY_TOOLS:
+        NAV_HISTORY_CACHE.pop(tab_id, None)
+    if tool_name not in PAGE_STATE_TOOLS:
+        PAGE_STATE_CACHE.pop(tab_id, None)
+    if tool_name not in ELEMENT_STATE_TOOLS:
+        for element_id in TAB_ELEMENTS.get(tab_id, ()):
+            ELEMENT_STATE_CACHE.pop(element_id, None)
+            ELEMENT_HTML_CACHE.pop(element_id, None)
+
 async def handle_tool_call_async(request_id: Any, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Handle tool calls asynchronously with proper timeout handling"""
     try:
-        if tool_name not in TOOL_HANDLERS:
+        handler = TOOL_HANDLERS.get(tool_name)
+        if handler is None:
             result = create_error_response(f"Unknown tool: {tool_name}")
         else:
             # Use timeout for all operations to prevent hanging
             timeout = 60  # 60 second timeout for operations
-            handler = TOOL_HANDLERS[tool_name]
+            
+            _invalidate_page_caches(tool_name, arguments)
             
             try:
-                result = await asyncio.wait_for(handler(**arguments), timeout=timeout)
+                result = await run_with_timeout(handler(**arguments), timeout)
             except asyncio.TimeoutError:
                 result = create_error_response(f"Operation '{tool_name}' timed out after {timeout} seconds")
             except Exception as e:
-                result = create_error_response(f"Operation '{tool_name}' failed: {str(e)}")
+                result = create_exception_response(f"Operation '{tool_name}' failed", e)
         
         return {
             "jsonrpc": "2.0",
@@ -1740,7 +2192,7 @@ async def handle_tool_call_async(request_id: Any, tool_name: str, arguments: Dic
         
     except Exception as e:
         error_message = f"Error executing {tool_name}: {str(e)}"
-        logger.error(f"{error_message}\n{traceback.format_exc()}")
+        logger.error("%s\n%s", error_message, traceback.format_exc())
         return {
             "jsonrpc": "2.0",
             "id": request_id,
@@ -1821,7 +2273,8 @@ async def create_browser_session(
             for arg in additional_args:
                 options.add_argument(arg)
         
-        logger.info(f"Creating Chrome browser for session {session_id} with options: {[arg for arg in options.arguments]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Creating Chrome browser for session %s with options: %s", session_id, list(options.arguments))
         
         # Create the browser instance (without context manager for persistent sessions)
         browser = Chrome(options=options)
@@ -1829,15 +2282,14 @@ async def create_browser_session(
         # Store browser instance
         BROWSER_SESSIONS[session_id] = browser
         
-        logger.info(f"Browser session '{session_id}' created successfully (not started yet)")
+        logger.info("Browser session '%s' created successfully (not started yet)", session_id)
         
         return create_success_response(f"Browser session '{session_id}' created. Use start_browser_session to initialize.")
         
     except Exception as e:
-        logger.error(f"Failed to create browser session {session_id}: {e}")
-        import traceback
+        logger.error("Failed to create browser session %s: %s", session_id, e)
         traceback.print_exc()
-        return create_error_response(f"Failed to create browser session: {str(e)}")
+        return create_exception_response("Failed to create browser session", e)
 
 async def start_browser_session(session_id: str) -> Dict[str, Any]:
     """Start an existing browser session and create initial tab"""
@@ -1853,83 +2305,44 @@ async def start_browser_session(session_id: str) -> Dict[str, Any]:
             return create_success_response(f"Browser session '{session_id}' already started with tab '{initial_tab_id}'")
         
         try:
-            logger.info(f"Starting browser for session {session_id}")
+            logger.info("Starting browser for session %s", session_id)
             initial_tab = await asyncio.wait_for(browser.start(), timeout=60)
-            logger.info(f"Browser started successfully for session {session_id}, tab type: {type(initial_tab)}")
+            logger.info("Browser started successfully for session %s, tab type: %s", session_id, type(initial_tab))
             
             # Inject shadow DOM override script to make all shadow roots open
             try:
-                shadow_override_script = """
-                    // Override attachShadow to force open mode for better automation access
-                    if (typeof Element !== 'undefined' && Element.prototype.attachShadow) {
-                        Element.prototype._originalAttachShadow = Element.prototype.attachShadow;
-                        Element.prototype.attachShadow = function(options) {
-                            // Always use open mode for automation compatibility
-                            return this._originalAttachShadow.call(this, { mode: "open" });
-                        };
-                    }
-                """
-                
-                await initial_tab._execute_command({
-                    "method": "Page.addScriptToEvaluateOnNewDocument", 
-                    "params": {"source": shadow_override_script}
-                })
-                logger.info(f"Shadow DOM override script injected for initial tab {initial_tab_id}")
+                # Shallow copy: PyDoll stamps a command id onto the dict it sends
+                await initial_tab._execute_command(dict(SHADOW_DOM_OVERRIDE_COMMAND))
+                logger.info("Shadow DOM override script injected for initial tab %s", initial_tab_id)
             except Exception as e:
-                logger.warning(f"Failed to inject shadow DOM override: {e}")
+                logger.warning("Failed to inject shadow DOM override: %s", e)
             
             # Store the initial tab
             TAB_SESSIONS[initial_tab_id] = initial_tab
-            logger.info(f"Initial tab stored with ID {initial_tab_id}")
+            set_active_tab(initial_tab_id)
+            SESSION_TABS.setdefault(session_id, set()).add(initial_tab_id)
+            logger.info("Initial tab stored with ID %s", initial_tab_id)
             
             # Automatically enable Cloudflare bypass for initial tab
             try:
                 await initial_tab.enable_auto_solve_cloudflare_captcha()
-                logger.info(f"Auto Cloudflare bypass enabled for initial tab {initial_tab_id}")
+                logger.info("Auto Cloudflare bypass enabled for initial tab %s", initial_tab_id)
             except Exception as e:
-                logger.warning(f"Failed to enable auto Cloudflare bypass for initial tab {initial_tab_id}: {e}")
+                logger.warning("Failed to enable auto Cloudflare bypass for initial tab %s: %s", initial_tab_id, e)
             
             return create_success_response(f"Browser session '{session_id}' started with initial tab '{initial_tab_id}'")
             
         except asyncio.TimeoutError:
-            logger.error(f"Browser start timed out for session {session_id}")
+            logger.error("Browser start timed out for session %s", session_id)
             return create_error_response("Browser start timed out after 60 seconds")
         except Exception as e:
-            logger.error(f"Browser start failed for session {session_id}: {e}")
-            import traceback
+            logger.error("Browser start failed for session %s: %s", session_id, e)
             traceback.print_exc()
-            return create_error_response(f"Browser start failed: {str(e)}")
+            return create_exception_response("Browser start failed", e)
             
     except Exception as e:
-        logger.error(f"Failed to start browser session: {e}")
-        return create_error_response(f"Failed to start browser session: {str(e)}")
-
-async def close_browser_session(session_id: str) -> Dict[str, Any]:
-    """Close a browser session and cleanup resources"""
-    try:
-        browser = get_browser_session(session_id)
-        if not browser:
-            return create_error_response(f"Browser session '{session_id}' not found")
-        
-        # Clean up related tabs and elements
-        tabs_to_remove = [tab_id for tab_id, tab in TAB_SESSIONS.items() 
-                          if hasattr(tab, 'browser') and tab.browser == browser]
-        for tab_id in tabs_to_remove:
-            del TAB_SESSIONS[tab_id]
-        
-        # Clean up elements for this browser
-        elements_to_remove = [elem_id for elem_id, elem in ELEMENT_CACHE.items()
-                              if hasattr(elem, 'tab') and elem.tab in tabs_to_remove]
-        for elem_id in elements_to_remove:
-            del ELEMENT_CACHE[elem_id]
-        
-        await browser.stop()
-        del BROWSER_SESSIONS[session_id]
-        
-        return create_success_response(f"Browser session '{session_id}' closed successfully")
-        
-    except Exception as e:
-        return create_error_response(f"Failed to close browser session: {str(e)}")
+        logger.error("Failed to start browser session: %s", e)
+        return create_exception_response("Failed to start browser session", e)
 
 # === TAB MANAGEMENT ===
 
@@ -2042,67 +2455,75 @@ async def _detect_cloudflare_protection(tab) -> bool:
 async def _find_and_click_in_cross_origin_iframe(tab) -> bool:
     """Use CDP commands to access cross-origin iframes and find Turnstile checkbox"""
     try:
-        print("DEBUG: Starting CDP iframe access...")
+        cloudflare_logger.debug("Starting CDP iframe access...")
         
-        # Get document with full depth to see all frames
-        doc_response = await tab._execute_command({
-            "method": "DOM.getDocument", 
-            "params": {"depth": -1, "pierce": True}
+        # Walk the frame tree instead of serializing the whole DOM - only the
+        # iframe owner nodes are needed
+        frame_tree = await tab._execute_command({
+            "method": "Page.getFrameTree",
+            "params": {}
         })
-        print(f"DEBUG: Got document response: {doc_response.get('result', {}).get('root', {}).get('nodeId', 'N/A')}")
         
-        # Find all iframe elements
-        iframe_query = await tab._execute_command({
-            "method": "DOM.querySelectorAll",
-            "params": {
-                "nodeId": doc_response["result"]["root"]["nodeId"],
-                "selector": "iframe"
-            }
+        child_frame_ids = []
+        
+        def collect_child_frames(tree_node):
+            for child in tree_node.get("childFrames", []):
+                child_frame_ids.append(child["frame"]["id"])
+                collect_child_frames(child)
+        
+        collect_child_frames(frame_tree["result"]["frameTree"])
+        
+        iframe_count = len(child_frame_ids)
+        cloudflare_logger.debug("Found %s child frames", iframe_count)
+        
+        # The target list is browser-wide, so fetch it once for all iframes
+        targets = await tab._execute_command({
+            "method": "Target.getTargets", 
+            "params": {}
         })
         
-        iframe_count = len(iframe_query["result"]["nodeIds"])
-        print(f"DEBUG: Found {iframe_count} iframe elements")
+        iframe_targets = [t for t in targets["result"]["targetInfos"] if t.get("type") == "iframe"]
+        if cloudflare_logger.isEnabledFor(logging.DEBUG):
+            cloudflare_logger.debug("Found %s iframe targets: %s", len(iframe_targets), [t.get('targetId') for t in iframe_targets])
+        next_target_index = 0
         
-        for i, node_id in enumerate(iframe_query["result"]["nodeIds"]):
+        for i, child_frame_id in enumerate(child_frame_ids):
             try:
-                print(f"DEBUG: Processing iframe {i+1}/{iframe_count}, nodeId: {node_id}")
+                # Resolve the <iframe> element that owns this frame
+                owner = await tab._execute_command({
+                    "method": "DOM.getFrameOwner",
+                    "params": {"frameId": child_frame_id}
+                })
+                backend_node_id = owner["result"]["backendNodeId"]
+                cloudflare_logger.debug("Processing iframe %s/%s, backendNodeId: %s", i+1, iframe_count, backend_node_id)
                 
                 # Get iframe description to access frameId
                 iframe_desc = await tab._execute_command({
                     "method": "DOM.describeNode",
-                    "params": {"nodeId": node_id}
+                    "params": {"backendNodeId": backend_node_id}
                 })
                 
                 frame_info = iframe_desc["result"]["node"]
-                print(f"DEBUG: Iframe {i+1} info: {frame_info.get('attributes', [])} hasContentDocument: {'contentDocument' in frame_info} hasFrameId: {'frameId' in frame_info}")
+                cloudflare_logger.debug("Iframe %s info: %s hasContentDocument: %s hasFrameId: %s", i+1, frame_info.get('attributes', []), 'contentDocument' in frame_info, 'frameId' in frame_info)
                 
                 # Check if this might be a challenge iframe
                 if ("contentDocument" not in frame_info and 
                     "frameId" in frame_info):
                     
                     frame_id = frame_info["frameId"]
-                    print(f"DEBUG: Found potential cross-origin iframe with frameId: {frame_id}")
-                    
-                    # Get targets to see available frames
-                    targets = await tab._execute_command({
-                        "method": "Target.getTargets", 
-                        "params": {}
-                    })
-                    
-                    iframe_targets = [t for t in targets["result"]["targetInfos"] if t.get("type") == "iframe"]
-                    print(f"DEBUG: Found {len(iframe_targets)} iframe targets: {[t.get('targetId') for t in iframe_targets]}")
+                    cloudflare_logger.debug("Found potential cross-origin iframe with frameId: %s", frame_id)
                     
-                    # Look for target matching our frameId or just take first iframe target
+                    # Take the next iframe target not yet tried
                     target_id = None
-                    for target in iframe_targets:
-                        if target.get("type") == "iframe":
-                            target_id = target["targetId"]
-                            print(f"DEBUG: Selected target: {target_id} url: {target.get('url', 'N/A')}")
-                            break
+                    if next_target_index < len(iframe_targets):
+                        target = iframe_targets[next_target_index]
+                        next_target_index += 1
+                        target_id = target["targetId"]
+                        cloudflare_logger.debug("Selected target: %s url: %s", target_id, target.get('url', 'N/A'))
                     
                     if target_id:
                         try:
-                            print(f"DEBUG: Attempting to attach to target: {target_id}")
+                            cloudflare_logger.debug("Attempting to attach to target: %s", target_id)
                             
                             # Create session for iframe target
                             session_response = await tab._execute_command({
@@ -2111,7 +2532,7 @@ async def _find_and_click_in_cross_origin_iframe(tab) -> bool:
                             })
                             
                             session_id = session_response["result"]["sessionId"]
-                            print(f"DEBUG: Created iframe session: {session_id}")
+                            cloudflare_logger.debug("Created iframe session: %s", session_id)
                             
                             # Enable DOM for iframe session
                             dom_enable_response = await tab._execute_command({
@@ -2119,18 +2540,19 @@ async def _find_and_click_in_cross_origin_iframe(tab) -> bool:
                                 "params": {},
                                 "sessionId": session_id
                             })
-                            print(f"DEBUG: DOM enabled for iframe session: {dom_enable_response}")
+                            cloudflare_logger.debug("DOM enabled for iframe session: %s", dom_enable_response)
                             
                             # Add delay for iframe to fully load
                             await asyncio.sleep(1)
                             
                             # Get iframe document
+                            # Only the root nodeId is needed for the selector queries below
                             iframe_doc = await tab._execute_command({
                                 "method": "DOM.getDocument",
-                                "params": {"depth": -1, "pierce": True},
+                                "params": {"depth": 0},
                                 "sessionId": session_id
                             })
-                            print(f"DEBUG: Got iframe document: {iframe_doc.get('result', {}).get('root', {}).get('nodeId', 'N/A')}")
+                            cloudflare_logger.debug("Got iframe document: %s", iframe_doc.get('result', {}).get('root', {}).get('nodeId', 'N/A'))
                             
                             # Look for checkboxes and clickable elements in iframe
                             selectors = [
@@ -2145,7 +2567,7 @@ async def _find_and_click_in_cross_origin_iframe(tab) -> bool:
                             
                             for selector in selectors:
                                 try:
-                                    print(f"DEBUG: Searching for selector '{selector}' in iframe...")
+                                    cloudflare_logger.debug("Searching for selector '%s' in iframe...", selector)
                                     
                                     element_query = await tab._execute_command({
                                         "method": "DOM.querySelector",
@@ -2158,7 +2580,7 @@ async def _find_and_click_in_cross_origin_iframe(tab) -> bool:
                                     
                                     element_node_id = element_query["result"]["nodeId"]
                                     if element_node_id:
-                                        print(f"DEBUG: Found element with selector '{selector}', nodeId: {element_node_id}")
+                                        cloudflare_logger.debug("Found element with selector '%s', nodeId: %s", selector, element_node_id)
                                         
                                         # Get element details
                                         element_desc = await tab._execute_command({
@@ -2166,7 +2588,7 @@ async def _find_and_click_in_cross_origin_iframe(tab) -> bool:
                                             "params": {"nodeId": element_node_id},
                                             "sessionId": session_id
                                         })
-                                        print(f"DEBUG: Element details: {element_desc.get('result', {}).get('node', {})}")
+                                        cloudflare_logger.debug("Element details: %s", element_desc.get('result', {}).get('node', {}))
                                         
                                         # Focus element first
                                         focus_response = await tab._execute_command({
@@ -2174,7 +2596,7 @@ async def _find_and_click_in_cross_origin_iframe(tab) -> bool:
                                             "params": {"nodeId": element_node_id},
                                             "sessionId": session_id
                                         })
-                                        print(f"DEBUG: Focus response: {focus_response}")
+                                        cloudflare_logger.debug("Focus response: %s", focus_response)
                                         
                                         # Get element bounds for clicking
                                         box_model = await tab._execute_command({
@@ -2182,14 +2604,14 @@ async def _find_and_click_in_cross_origin_iframe(tab) -> bool:
                                             "params": {"nodeId": element_node_id},
                                             "sessionId": session_id
                                         })
-                                        print(f"DEBUG: Box model response: {box_model}")
+                                        cloudflare_logger.debug("Box model response: %s", box_model)
                                         
                                         if "result" in box_model and "content" in box_model["result"]:
                                             content = box_model["result"]["content"]
                                             # Calculate center point
                                             x = (content[0] + content[4]) / 2
                                             y = (content[1] + content[5]) / 2
-                                            print(f"DEBUG: Click coordinates: x={x}, y={y}")
+                                            cloudflare_logger.debug("Click coordinates: x=%s, y=%s", x, y)
                                             
                                             # Try multiple click methods
                                             click_methods = [
@@ -2203,11 +2625,11 @@ async def _find_and_click_in_cross_origin_iframe(tab) -> bool:
                                             
                                             for method_idx, click_method in enumerate(click_methods):
                                                 try:
-                                                    print(f"DEBUG: Attempting click method {method_idx + 1}")
+                                                    cloudflare_logger.debug("Attempting click method %s", method_idx + 1)
                                                     await click_method()
                                                     await asyncio.sleep(0.5)  # Small delay between attempts
                                                     
-                                                    print(f'DEBUG: Clicked {selector} in cross-origin iframe via CDP (method {method_idx + 1})')
+                                                    cloudflare_logger.debug("Clicked %s in cross-origin iframe via CDP (method %s)", selector, method_idx + 1)
                                                     
                                                     # Clean up session and return success
                                                     await tab._execute_command({
@@ -2218,14 +2640,14 @@ async def _find_and_click_in_cross_origin_iframe(tab) -> bool:
                                                     return True
                                                     
                                                 except Exception as click_error:
-                                                    print(f"DEBUG: Click method {method_idx + 1} failed: {click_error}")
+                                                    cloudflare_logger.debug("Click method %s failed: %s", method_idx + 1, click_error)
                                                     continue
                                             
                                 except Exception as selector_error:
-                                    print(f"DEBUG: Selector '{selector}' failed: {selector_error}")
+                                    cloudflare_logger.debug("Selector '%s' failed: %s", selector, selector_error)
                                     continue
                             
-                            print("DEBUG: No clickable elements found in iframe")
+                            cloudflare_logger.debug("No clickable elements found in iframe")
                             
                             # Clean up session if we get here
                             await tab._execute_command({
@@ -2234,61 +2656,60 @@ async def _find_and_click_in_cross_origin_iframe(tab) -> bool:
                             })
                             
                         except Exception as target_error:
-                            print(f"DEBUG: Target attachment failed: {target_error}")
+                            cloudflare_logger.debug("Target attachment failed: %s", target_error)
                             continue
                     else:
-                        print("DEBUG: No iframe targets found")
+                        cloudflare_logger.debug("No iframe targets found")
                         
             except Exception as iframe_error:
-                print(f"DEBUG: Processing iframe {i+1} failed: {iframe_error}")
+                cloudflare_logger.debug("Processing iframe %s failed: %s", i+1, iframe_error)
                 continue
         
-        print("DEBUG: CDP iframe access completed - no successful clicks")
+        cloudflare_logger.debug("CDP iframe access completed - no successful clicks")
         return False
         
     except Exception as main_error:
-        print(f"DEBUG: CDP iframe access main error: {main_error}")
+        cloudflare_logger.debug("CDP iframe access main error: %s", main_error)
         return False
 
 
 async def _execute_mouse_click(tab, session_id, x, y, method_name):
     """Execute standard mouse click events"""
-    print(f"DEBUG: Executing {method_name} mouse click at ({x}, {y})")
+    cloudflare_logger.debug("Executing %s mouse click at (%s, %s)", method_name, x, y)
     
-    # Mouse press
-    press_response = await tab._execute_command({
-        "method": "Input.dispatchMouseEvent",
-        "params": {
-            "type": "mousePressed",
-            "x": x,
-            "y": y,
-            "button": "left",
-            "clickCount": 1
-        },
-        "sessionId": session_id
-    })
-    print(f"DEBUG: Mouse press response: {press_response}")
-    
-    await asyncio.sleep(0.1)  # Brief delay between press and release
-    
-    # Mouse release
-    release_response = await tab._execute_command({
-        "method": "Input.dispatchMouseEvent",
-        "params": {
-            "type": "mouseReleased",
-            "x": x,
-            "y": y,
-            "button": "left",
-            "clickCount": 1
-        },
-        "sessionId": session_id
-    })
-    print(f"DEBUG: Mouse release response: {release_response}")
+    # Chromium processes input events in order, so press and release can be
+    # pipelined without waiting for each round trip
+    press_response, release_response = await asyncio.gather(
+        tab._execute_command({
+            "method": "Input.dispatchMouseEvent",
+            "params": {
+                "type": "mousePressed",
+                "x": x,
+                "y": y,
+                "button": "left",
+                "clickCount": 1
+            },
+            "sessionId": session_id
+        }),
+        tab._execute_command({
+            "method": "Input.dispatchMouseEvent",
+            "params": {
+                "type": "mouseReleased",
+                "x": x,
+                "y": y,
+                "button": "left",
+                "clickCount": 1
+            },
+            "sessionId": session_id
+        })
+    )
+    cloudflare_logger.debug("Mouse press response: %s", press_response)
+    cloudflare_logger.debug("Mouse release response: %s", release_response)
 
 
 async def _execute_js_click(tab, session_id, node_id):
     """Execute JavaScript click on element"""
-    print(f"DEBUG: Executing JavaScript click on nodeId: {node_id}")
+    cloudflare_logger.debug("Executing JavaScript click on nodeId: %s", node_id)
     
     # Try to click via JavaScript
     js_response = await tab._execute_command({
@@ -2306,12 +2727,12 @@ async def _execute_js_click(tab, session_id, node_id):
         },
         "sessionId": session_id
     })
-    print(f"DEBUG: JavaScript click response: {js_response}")
+    cloudflare_logger.debug("JavaScript click response: %s", js_response)
 
 
 async def _execute_touch_click(tab, session_id, x, y):
     """Execute touch events for mobile simulation"""
-    print(f"DEBUG: Executing touch click at ({x}, {y})")
+    cloudflare_logger.debug("Executing touch click at (%s, %s)", x, y)
     
     # Touch start
     touch_start = await tab._execute_command({
@@ -2327,7 +2748,7 @@ async def _execute_touch_click(tab, session_id, x, y):
         },
         "sessionId": session_id
     })
-    print(f"DEBUG: Touch start response: {touch_start}")
+    cloudflare_logger.debug("Touch start response: %s", touch_start)
     
     await asyncio.sleep(0.1)
     
@@ -2340,7 +2761,7 @@ async def _execute_touch_click(tab, session_id, x, y):
         },
         "sessionId": session_id
     })
-    print(f"DEBUG: Touch end response: {touch_end}")
+    cloudflare_logger.debug("Touch end response: %s", touch_end)
 
 
 async def _attempt_cloudflare_bypass(tab) -> bool:
@@ -2354,9 +2775,9 @@ async def _attempt_cloudflare_bypass(tab) -> bool:
             captcha = await tab.find_element(By.CSS_SELECTOR, ".cf-turnstile", timeout=2, raise_exc=False)
             if captcha:
                 await captcha.click(x_offset=-125, y_offset=0)
-                print('Clicked Cloudflare captcha (direct DOM)')
+                cloudflare_logger.info('Clicked Cloudflare captcha (direct DOM)')
                 if await _verify_cloudflare_bypass(tab):
-                    print('Cloudflare bypass verified successful (direct DOM)')
+                    cloudflare_logger.info('Cloudflare bypass verified successful (direct DOM)')
                     return True
         except Exception:
             pass
@@ -2423,18 +2844,18 @@ async def _attempt_cloudflare_bypass(tab) -> bool:
                             """, iframe)
                             
                             if captcha_found:
-                                print('Clicked Cloudflare captcha (iframe content)')
+                                cloudflare_logger.info('Clicked Cloudflare captcha (iframe content)')
                                 # Wait and verify success
                                 if await _verify_cloudflare_bypass(tab):
-                                    print('Cloudflare bypass verified successful')
+                                    cloudflare_logger.info('Cloudflare bypass verified successful')
                                     return True
                                 
                         except Exception:
                             # If can't access iframe content, try clicking iframe with offset
                             await iframe.click(x_offset=-50, y_offset=0)
-                            print('Clicked Cloudflare captcha (iframe with offset)')
+                            cloudflare_logger.info('Clicked Cloudflare captcha (iframe with offset)')
                             if await _verify_cloudflare_bypass(tab):
-                                print('Cloudflare bypass verified successful (iframe offset)')
+                                cloudflare_logger.info('Cloudflare bypass verified successful (iframe offset)')
                                 return True
                             
                 except Exception:
@@ -2455,9 +2876,9 @@ async def _attempt_cloudflare_bypass(tab) -> bool:
                         turnstile = await shadow_root.find_element(By.CSS_SELECTOR, ".cf-turnstile", timeout=1, raise_exc=False)
                         if turnstile:
                             await turnstile.click(x_offset=-125, y_offset=0)
-                            print('Clicked Cloudflare captcha (shadow DOM)')
+                            cloudflare_logger.info('Clicked Cloudflare captcha (shadow DOM)')
                             if await _verify_cloudflare_bypass(tab):
-                                print('Cloudflare bypass verified successful (shadow DOM)')
+                                cloudflare_logger.info('Cloudflare bypass verified successful (shadow DOM)')
                                 return True
                         
                         # Also check for iframes within shadow root
@@ -2465,9 +2886,9 @@ async def _attempt_cloudflare_bypass(tab) -> bool:
                         for shadow_iframe in shadow_iframes:
                             try:
                                 await shadow_iframe.click(x_offset=-50, y_offset=0)
-                                print('Clicked Cloudflare captcha (shadow iframe)')
+                                cloudflare_logger.info('Clicked Cloudflare captcha (shadow iframe)')
                                 if await _verify_cloudflare_bypass(tab):
-                                    print('Cloudflare bypass verified successful (shadow iframe)')
+                                    cloudflare_logger.info('Cloudflare bypass verified successful (shadow iframe)')
                                     return True
                             except Exception:
                                 continue
@@ -2480,82 +2901,59 @@ async def _attempt_cloudflare_bypass(tab) -> bool:
         # Strategy 4: CDP cross-origin iframe access
         try:
             if await _find_and_click_in_cross_origin_iframe(tab):
-                print('Clicked Cloudflare captcha (CDP cross-origin)')
+                cloudflare_logger.info('Clicked Cloudflare captcha (CDP cross-origin)')
                 if await _verify_cloudflare_bypass(tab):
-                    print('Cloudflare bypass verified successful (CDP cross-origin)')
+                    cloudflare_logger.info('Cloudflare bypass verified successful (CDP cross-origin)')
                     return True
         except Exception:
             pass
         
         # Strategy 5: Fallback to PyDoll's built-in methods
-        try:
-            async with tab.expect_and_bypass_cloudflare_captcha(timeout=10):
+        # Strategies 1-4 already spent time on this page, so bound the wait here (PyDoll's
+        # helpers take no timeout) and only fall through to auto-solve when it ran out
+        async def expect_and_bypass():
+            async with tab.expect_and_bypass_cloudflare_captcha():
                 pass
-            return True
-        except Exception:
-            pass
         
         try:
-            await tab.enable_auto_solve_cloudflare_captcha(timeout=5)
-            await asyncio.sleep(2)
-            await tab.disable_auto_solve_cloudflare_captcha()
+            await run_with_timeout(expect_and_bypass(), 5)
             return True
+        except asyncio.TimeoutError:
+            try:
+                await tab.enable_auto_solve_cloudflare_captcha()
+                # Wait in the page for the Turnstile token instead of sleeping blindly
+                outcome = await _evaluate_promise(
+                    tab, WAIT_FOR_FUNCTION_SCRIPT % (TURNSTILE_SOLVED_CHECK, "[]", 2000, 100), 2
+                )
+                await tab.disable_auto_solve_cloudflare_captcha()
+                return isinstance(outcome, dict) and bool(outcome.get('value'))
+            except Exception:
+                pass
         except Exception:
             pass
-        
+
         return False
     except Exception:
         return False
 
 
-async def navigate(tab_id: str, url: str, wait_until: str = "load") -> Dict[str, Any]:
-    """Navigate tab to specified URL with page load waiting"""
-    try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            return create_error_response(f"Tab '{tab_id}' not found")
-        
-        # Map wait conditions to appropriate timeouts
-        timeout_map = {"load": 60, "domcontentloaded": 30, "networkidle": 90}
-        timeout = timeout_map.get(wait_until, 60)
-        
-        # First attempt normal navigation
-        await tab.go_to(url, timeout=timeout)
-        
-        # Check if Cloudflare protection is detected
-        cloudflare_detected = await _detect_cloudflare_protection(tab)
-        
-        if cloudflare_detected:
-            # Cloudflare detected, attempt bypass using direct approach
-            bypass_successful = await _attempt_cloudflare_bypass(tab)
-            
-            if bypass_successful:
-                return create_success_response(f"Successfully navigated to {url} (Cloudflare bypassed)")
-            else:
-                # If bypass failed, still return success since navigation worked
-                return create_success_response(f"Successfully navigated to {url} (Cloudflare detected but bypass failed)")
-        else:
-            # No Cloudflare detected, normal navigation successful
-            return create_success_response(f"Successfully navigated to {url}")
-        
-    except Exception as e:
-        return create_error_response(f"Failed to navigate: {str(e)}")
+# Map wait conditions to appropriate navigation timeouts (seconds)
+NAVIGATION_TIMEOUTS = {"load": 60, "domcontentloaded": 30, "networkidle": 90}
 
+# Hosts that are never served through Cloudflare, so detection can be skipped
+CLOUDFLARE_EXEMPT_HOSTS = {"localhost", "127.0.0.1", "::1", "0.0.0.0"}  # noqa: S104 - matched against URLs, nothing binds to it
 
 
-async def refresh_page(tab_id: str, ignore_cache: bool = False) -> Dict[str, Any]:
-    """Refresh/reload the current page"""
+def _is_cloudflare_exempt(url: str) -> bool:
+    """Check if a URL cannot be behind Cloudflare (local hosts, non-HTTP schemes)"""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            return create_error_response(f"Tab '{tab_id}' not found")
-        
-        await tab.refresh(ignore_cache=ignore_cache)
-        
-        return create_success_response("Page refreshed successfully")
-        
-    except Exception as e:
-        return create_error_response(f"Failed to refresh page: {str(e)}")
+        parsed = urllib.parse.urlparse(url)
+    except ValueError:
+        return False
+    if parsed.scheme not in ("http", "https"):
+        return True
+    return parsed.hostname in CLOUDFLARE_EXEMPT_HOSTS
+
 
 async def close_browser_session(session_id: str):
     """Close a browser session and cleanup resources."""
@@ -2564,24 +2962,18 @@ async def close_browser_session(session_id: str):
             raise ValueError(f"Session '{session_id}' not found")
         
         browser = BROWSER_SESSIONS[session_id]
-        await browser.stop()
         
-        # Clean up related tabs
-        tabs_to_remove = [tab_id for tab_id in TAB_SESSIONS.keys() if tab_id.startswith(f"{session_id}_")]
-        for tab_id in tabs_to_remove:
-            del TAB_SESSIONS[tab_id]
-            if tab_id in EVENT_CALLBACKS:
-                del EVENT_CALLBACKS[tab_id]
-            if tab_id in EVENT_LOGS:
-                del EVENT_LOGS[tab_id]
-            if tab_id in NETWORK_LOGS:
-                del NETWORK_LOGS[tab_id]
+        # Close related tabs concurrently so their close timeouts overlap;
+        # close_tab also cleans up their elements, callbacks and logs
+        tab_ids = SESSION_TABS.pop(session_id, set())
+        await asyncio.gather(*(close_tab(tab_id) for tab_id in tab_ids), return_exceptions=True)
         
-        del BROWSER_SESSIONS[session_id]
+        await browser.stop()
+        BROWSER_SESSIONS.pop(session_id, None)
         
         return create_success_response(f"Browser session '{session_id}' closed successfully")
     except Exception as e:
-        return create_error_response(f"Failed to close browser session: {str(e)}")
+        return create_exception_response("Failed to close browser session", e)
 
 async def create_tab(browser_session_id: str, tab_id: str, url: Optional[str] = None):
     """Create a new tab in browser session."""
@@ -2595,113 +2987,76 @@ async def create_tab(browser_session_id: str, tab_id: str, url: Optional[str] =
         browser = BROWSER_SESSIONS[browser_session_id]
         
         # Create new tab (browser should already be started)
-        logger.info(f"Creating new tab {tab_id} for session {browser_session_id}")
+        logger.info("Creating new tab %s for session %s", tab_id, browser_session_id)
         tab = await browser.new_tab(url or "")
-        logger.info(f"Tab created successfully: {tab_id}")
+        logger.info("Tab created successfully: %s", tab_id)
+        
+        # Inject shadow DOM override script and enable Cloudflare bypass for this tab.
+        # Both are independent best-effort CDP calls, so run them concurrently.
+        shadow_result, cloudflare_result = await asyncio.gather(
+            tab._execute_command(dict(SHADOW_DOM_OVERRIDE_COMMAND)),
+            tab.enable_auto_solve_cloudflare_captcha(),
+            return_exceptions=True
+        )
         
-        # Inject shadow DOM override script for this tab too
-        try:
-            shadow_override_script = """
-                // Override attachShadow to force open mode for better automation access
-                if (typeof Element !== 'undefined' && Element.prototype.attachShadow) {
-                    Element.prototype._originalAttachShadow = Element.prototype.attachShadow;
-                    Element.prototype.attachShadow = function(options) {
-                        // Always use open mode for automation compatibility
-                        return this._originalAttachShadow.call(this, { mode: "open" });
-                    };
-                }
-            """
-            
-            await tab._execute_command({
-                "method": "Page.addScriptToEvaluateOnNewDocument", 
-                "params": {"source": shadow_override_script}
-            })
-            logger.info(f"Shadow DOM override script injected for tab {tab_id}")
-        except Exception as e:
-            logger.warning(f"Failed to inject shadow DOM override for tab {tab_id}: {e}")
+        if isinstance(shadow_result, Exception):
+            logger.warning("Failed to inject shadow DOM override for tab %s: %s", tab_id, shadow_result)
+        else:
+            logger.info("Shadow DOM override script injected for tab %s", tab_id)
         
-        # Automatically enable Cloudflare bypass for all tabs
-        try:
-            await tab.enable_auto_solve_cloudflare_captcha()
-            logger.info(f"Auto Cloudflare bypass enabled for tab {tab_id}")
-        except Exception as e:
-            logger.warning(f"Failed to enable auto Cloudflare bypass for tab {tab_id}: {e}")
+        if isinstance(cloudflare_result, Exception):
+            logger.warning("Failed to enable auto Cloudflare bypass for tab %s: %s", tab_id, cloudflare_result)
+        else:
+            logger.info("Auto Cloudflare bypass enabled for tab %s", tab_id)
         
         TAB_SESSIONS[tab_id] = tab
+        SESSION_TABS.setdefault(browser_session_id, set()).add(tab_id)
+        set_active_tab(tab_id)
         
         return create_success_response(f"Tab '{tab_id}' created successfully" + (f" and navigated to {url}" if url else ""))
     except asyncio.TimeoutError:
         return create_error_response(f"Failed to create tab: Operation timed out")
     except Exception as e:
-        return create_error_response(f"Failed to create tab: {str(e)}")
+        return create_exception_response("Failed to create tab", e)
 
 async def close_tab(tab_id: str):
     """Close a browser tab."""
-    logger.info(f"close_tab called for tab_id: {tab_id}")
+    logger.info("close_tab called for tab_id: %s", tab_id)
     try:
         if tab_id not in TAB_SESSIONS:
-            logger.error(f"Tab {tab_id} not found in TAB_SESSIONS")
+            logger.error("Tab %s not found in TAB_SESSIONS", tab_id)
             raise ValueError(f"Tab '{tab_id}' not found")
         
-        logger.info(f"Tab {tab_id} found in TAB_SESSIONS, getting tab object")
+        logger.info("Tab %s found in TAB_SESSIONS, getting tab object", tab_id)
         tab = TAB_SESSIONS[tab_id]
-        logger.info(f"Got tab object for {tab_id}: {type(tab)}")
+        logger.info("Got tab object for %s: %s", tab_id, type(tab))
         
         # Try to close the tab via PyDoll, but don't let it fail the entire operation
         # PyDoll tabs often can't be closed cleanly due to internal browser state issues
         close_successful = False
         try:
-            logger.info(f"Attempting to close PyDoll tab for {tab_id}")
+            logger.info("Attempting to close PyDoll tab for %s", tab_id)
             await asyncio.wait_for(tab.close(), timeout=5.0)  # Shorter timeout
-            logger.info(f"Successfully closed PyDoll tab for {tab_id}")
+            logger.info("Successfully closed PyDoll tab for %s", tab_id)
             close_successful = True
         except Exception as close_error:
-            logger.info(f"PyDoll tab close failed for {tab_id} (continuing with cleanup): {str(close_error)[:100]}")
+            logger.info("PyDoll tab close failed for %s (continuing with cleanup): %.100s", tab_id, close_error)
             # Don't log full error details as this is expected behavior
         
-        # Clean up related elements and events step by step to isolate any errors
-        logger.info(f"Starting cleanup for tab {tab_id}")
-        
-        # Clean up elements
-        try:
-            elements_to_remove = [elem_id for elem_id in ELEMENT_CACHE.keys() if elem_id.startswith(f"{tab_id}_")]
-            logger.info(f"Found {len(elements_to_remove)} elements to clean up for {tab_id}")
-            for elem_id in elements_to_remove:
-                del ELEMENT_CACHE[elem_id]
-            logger.info(f"Cleaned up {len(elements_to_remove)} elements for {tab_id}")
-        except Exception as elem_error:
-            logger.warning(f"Error cleaning up elements for {tab_id}: {elem_error}")
-        
-        # Clean up event callbacks
-        try:
-            if tab_id in EVENT_CALLBACKS:
-                del EVENT_CALLBACKS[tab_id]
-                logger.info(f"Cleaned up event callbacks for {tab_id}")
-        except Exception as cb_error:
-            logger.warning(f"Error cleaning up event callbacks for {tab_id}: {cb_error}")
-        
-        # Clean up event logs
-        try:
-            if tab_id in EVENT_LOGS:
-                del EVENT_LOGS[tab_id]
-                logger.info(f"Cleaned up event logs for {tab_id}")
-        except Exception as log_error:
-            logger.warning(f"Error cleaning up event logs for {tab_id}: {log_error}")
-        
-        # Clean up network logs
-        try:
-            if tab_id in NETWORK_LOGS:
-                del NETWORK_LOGS[tab_id]
-                logger.info(f"Cleaned up network logs for {tab_id}")
-        except Exception as net_error:
-            logger.warning(f"Error cleaning up network logs for {tab_id}: {net_error}")
+        # Drop cached elements and per-tab event state; pop() with a default never raises
+        removed_count = _forget_tab_elements(tab_id)
+        for tab_state in (EVENT_CALLBACKS, EVENT_LOGS, NETWORK_LOGS, LAST_DIALOG, PAGE_STATE_CACHE):
+            tab_state.pop(tab_id, None)
+        logger.info("Cleaned up %s elements and event state for %s", removed_count, tab_id)
         
         # Finally, remove from TAB_SESSIONS
         try:
             del TAB_SESSIONS[tab_id]
-            logger.info(f"Removed {tab_id} from TAB_SESSIONS")
+            for session_tab_ids in SESSION_TABS.values():
+                session_tab_ids.discard(tab_id)
+            logger.info("Removed %s from TAB_SESSIONS", tab_id)
         except Exception as session_error:
-            logger.error(f"Critical error removing {tab_id} from TAB_SESSIONS: {session_error}")
+            logger.error("Critical error removing %s from TAB_SESSIONS: %s", tab_id, session_error)
             raise session_error
         
         if close_successful:
@@ -2709,69 +3064,76 @@ async def close_tab(tab_id: str):
         else:
             return create_success_response(f"Tab '{tab_id}' session cleaned up successfully")
     except Exception as e:
-        logger.error(f"Failed to close tab {tab_id}: {str(e)}", exc_info=True)
-        return create_error_response(f"Failed to close tab: {str(e)}")
+        logger.error("Failed to close tab %s: %s", tab_id, e, exc_info=True)
+        return create_exception_response("Failed to close tab", e)
 
 async def bring_tab_to_front(tab_id: str):
     """Bring a tab to the front/focus."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         await tab.bring_to_front()
+        set_active_tab(tab_id)
         
         return create_success_response(f"Tab '{tab_id}' brought to front")
     except Exception as e:
-        return create_error_response(f"Bring tab to front failed: {str(e)}")
+        return create_exception_response("Bring tab to front failed", e)
 
 async def navigate(tab_id: str, url: str, wait_until: str = "load"):
     """Navigate tab to specified URL."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
+        set_active_tab(tab_id)
         
-        await tab.go_to(url)
+        # Skip the navigation if the tab is already at this URL and past any challenge
+        if await tab.current_url == url and (
+            _is_cloudflare_exempt(url) or not await _detect_cloudflare_protection(tab)
+        ):
+            return create_success_response(f"Already at {url}, navigation skipped")
+        
+        await tab.go_to(url, timeout=NAVIGATION_TIMEOUTS.get(wait_until, 60))
         
         return create_success_response(f"Successfully navigated to {url}")
     except Exception as e:
-        return create_error_response(f"Navigation failed: {str(e)}")
+        return create_exception_response("Navigation failed", e)
+
+async def _get_navigation_history(tab_id: str, tab) -> Dict[str, Any]:
+    """Get a tab's navigation history, reusing the cached copy between history commands"""
+    history = NAV_HISTORY_CACHE.get(tab_id)
+    if history is None:
+        # Shallow copy: PyDoll stamps a command id onto the dict it sends
+        history_resp = await tab._execute_command(dict(NAV_HISTORY_COMMAND))
+        history = history_resp['result']
+        NAV_HISTORY_CACHE[tab_id] = history
+    return history
 
 async def go_back(tab_id: str):
     """Navigate back in browser history."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         # Get navigation history first
-        from pydoll.commands import PageCommands
-        history_resp = await tab._execute_command(PageCommands.get_navigation_history())
-        history = history_resp['result']
+        history = await _get_navigation_history(tab_id, tab)
         
         current_index = history['currentIndex']
         if current_index > 0:
             # Navigate to previous entry
             prev_entry_id = history['entries'][current_index - 1]['id']
             await tab._execute_command(PageCommands.navigate_to_history_entry(prev_entry_id))
+            history['currentIndex'] = current_index - 1
             return create_success_response("Successfully navigated back")
         else:
             return create_error_response("Cannot navigate back: already at the beginning of history")
     except Exception as e:
-        return create_error_response(f"Go back failed: {str(e)}")
+        return create_exception_response("Go back failed", e)
 
 async def go_forward(tab_id: str):
     """Navigate forward in browser history."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         # Get navigation history first
-        from pydoll.commands import PageCommands
-        history_resp = await tab._execute_command(PageCommands.get_navigation_history())
-        history = history_resp['result']
+        history = await _get_navigation_history(tab_id, tab)
         
         current_index = history['currentIndex']
         entries = history['entries']
@@ -2779,24 +3141,43 @@ async def go_forward(tab_id: str):
             # Navigate to next entry
             next_entry_id = entries[current_index + 1]['id']
             await tab._execute_command(PageCommands.navigate_to_history_entry(next_entry_id))
+            history['currentIndex'] = current_index + 1
             return create_success_response("Successfully navigated forward")
         else:
             return create_error_response("Cannot navigate forward: already at the end of history")
     except Exception as e:
-        return create_error_response(f"Go forward failed: {str(e)}")
+        return create_exception_response("Go forward failed", e)
 
 async def refresh_page(tab_id: str, ignore_cache: bool = False):
     """Refresh/reload the current page."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
-        await tab.refresh(ignore_cache=ignore_cache)
+        # A reload waits for the load event, so it gets the same bound as navigate's default
+        await run_with_timeout(tab.refresh(ignore_cache=ignore_cache), NAVIGATION_TIMEOUTS["load"])
         
         return create_success_response("Page refreshed successfully")
     except Exception as e:
-        return create_error_response(f"Page refresh failed: {str(e)}")
+        return create_exception_response("Page refresh failed", e)
+
+async def _dispatch_selector(
+    tab,
+    selector_type: str,
+    selector_value: str,
+    *,
+    find_all: bool = False,
+    timeout: Optional[float] = None,
+    raise_exc: bool = False
+):
+    """Run a SELECTOR_DISPATCH lookup, returning an element (or list when find_all)"""
+    find_fn = SELECTOR_DISPATCH.get(selector_type)
+    if find_fn is None:
+        raise ValueError(f"Invalid selector type: {selector_type}")
+    
+    kwargs = {"find_all": find_all, "raise_exc": raise_exc}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    return await find_fn(tab, selector_value, **kwargs)
 
 async def find_element(
     tab_id: str,
@@ -2807,54 +3188,33 @@ async def find_element(
 ):
     """Find a single element using various selector strategies."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
-        
-        # Handle existing element IDs by generating unique ones
-        original_id = base_element_id
-        counter = 1
-        while base_element_id in ELEMENT_CACHE:
-            base_element_id = f"{original_id}_{counter}"
-            counter += 1
-        
-        # Map selector types to PyDoll By constants
-        selector_map = {
-            "css": By.CSS_SELECTOR,
-            "xpath": By.XPATH,
-            "id": By.ID,
-            "name": By.NAME,
-            "tag": By.TAG_NAME,
-            "class": By.CLASS_NAME,
-        }
-        
-        if selector_type not in selector_map:
-            raise ValueError(f"Invalid selector type: {selector_type}")
-        
-        by_type = selector_map[selector_type]
-        if selector_type == "css":
-            element = await tab.query(selector_value, timeout=timeout, raise_exc=False)
-        elif selector_type == "xpath":
-            element = await tab.query(selector_value, timeout=timeout, raise_exc=False)
-        elif selector_type == "id":
-            element = await tab.find(id=selector_value, timeout=timeout, raise_exc=False)
-        elif selector_type == "name":
-            element = await tab.find(name=selector_value, timeout=timeout, raise_exc=False)
-        elif selector_type == "tag":
-            element = await tab.find(tag_name=selector_value, timeout=timeout, raise_exc=False)
-        elif selector_type == "class":
-            element = await tab.find(class_name=selector_value, timeout=timeout, raise_exc=False)
-        else:
-            element = await tab._find_element(by_type, selector_value, raise_exc=False)
+        tab = require_tab(tab_id)
+        
+        # Handle existing element IDs by generating unique ones; the per-base counter
+        # resumes where the last collision left off instead of probing from 1. IDs claimed
+        # by concurrent finds still in flight count as taken.
+        if base_element_id in ELEMENT_CACHE or base_element_id in _PENDING_ELEMENT_IDS:
+            original_id = base_element_id
+            counter = _ID_COUNTERS.get(original_id, 0)
+            while base_element_id in ELEMENT_CACHE or base_element_id in _PENDING_ELEMENT_IDS:
+                counter += 1
+                base_element_id = f"{original_id}_{counter}"
+            _ID_COUNTERS[original_id] = counter
+        
+        _PENDING_ELEMENT_IDS.add(base_element_id)
+        try:
+            element = await _dispatch_selector(tab, selector_type, selector_value, timeout=timeout)
+        finally:
+            _PENDING_ELEMENT_IDS.discard(base_element_id)
         
         if not element:
             raise ValueError(f"Element not found with selector '{selector_type}': {selector_value}")
         
-        ELEMENT_CACHE[base_element_id] = element
+        _cache_set(base_element_id, element, tab_id)
         
         return create_success_response(f"Element '{base_element_id}' found successfully")
     except Exception as e:
-        return create_error_response(f"Find element failed: {str(e)}")
+        return create_exception_response("Find element failed", e)
 
 async def find_elements(
     tab_id: str,
@@ -2865,38 +3225,9 @@ async def find_elements(
 ):
     """Find multiple elements using selector strategy."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
-        # Map selector types to PyDoll By constants
-        selector_map = {
-            "css": By.CSS_SELECTOR,
-            "xpath": By.XPATH,
-            "id": By.ID,
-            "name": By.NAME,
-            "tag": By.TAG_NAME,
-            "class": By.CLASS_NAME,
-        }
-        
-        if selector_type not in selector_map:
-            raise ValueError(f"Invalid selector type: {selector_type}")
-        
-        by_type = selector_map[selector_type]
-        if selector_type == "css":
-            elements = await tab.query(selector_value, find_all=True, raise_exc=False) or []
-        elif selector_type == "xpath":
-            elements = await tab.query(selector_value, find_all=True, raise_exc=False) or []
-        elif selector_type == "id":
-            elements = await tab.find(id=selector_value, find_all=True, raise_exc=False) or []
-        elif selector_type == "name":
-            elements = await tab.find(name=selector_value, find_all=True, raise_exc=False) or []
-        elif selector_type == "tag":
-            elements = await tab.find(tag_name=selector_value, find_all=True, raise_exc=False) or []
-        elif selector_type == "class":
-            elements = await tab.find(class_name=selector_value, find_all=True, raise_exc=False) or []
-        else:
-            elements = await tab._find_elements(by_type, selector_value, raise_exc=False)
+        elements = await _dispatch_selector(tab, selector_type, selector_value, find_all=True) or []
         
         if limit:
             elements = elements[:limit]
@@ -2904,12 +3235,12 @@ async def find_elements(
         element_ids = []
         for i, element in enumerate(elements):
             element_id = f"{base_element_id}_{i}"
-            ELEMENT_CACHE[element_id] = element
+            _cache_set(element_id, element, tab_id)
             element_ids.append(element_id)
         
         return create_success_response(f"Found {len(element_ids)} elements: {', '.join(element_ids)}")
     except Exception as e:
-        return create_error_response(f"Find elements failed: {str(e)}")
+        return create_exception_response("Find elements failed", e)
 
 async def click_element(element_id: str, button: str = "left", click_count: int = 1, x_offset: int = 0, y_offset: int = 0, hold_time: float = 0.1):
     """Click an element using mouse simulation."""
@@ -2918,30 +3249,17 @@ async def click_element(element_id: str, button: str = "left", click_count: int
         if not element:
             raise ValueError(f"Element '{element_id}' not found")
         
-        # Handle offsets and hold time if specified
-        if x_offset != 0 or y_offset != 0 or hold_time != 0.1:
-            # For complex clicking, use standard element click for now
-            # Future enhancement: implement precise coordinate clicking with hold time
-            if click_count == 1:
-                if button == "right":
-                    await element.right_click()
-                else:
-                    await element.click()
-            else:
-                await element.double_click() if click_count == 2 else await element.click()
+        if click_count == 1 and button == "right":
+            await element.right_click()
+        elif click_count == 2:
+            await element.double_click()
         else:
-            # Standard clicking
-            if click_count == 1:
-                if button == "right":
-                    await element.right_click()
-                else:
-                    await element.click()
-            else:
-                await element.double_click() if click_count == 2 else await element.click()
+            # PyDoll's click() natively supports offsets and hold time
+            await element.click(x_offset=x_offset, y_offset=y_offset, hold_time=hold_time)
         
         return create_success_response(f"Element '{element_id}' clicked successfully")
     except Exception as e:
-        return create_error_response(f"Click element failed: {str(e)}")
+        return create_exception_response("Click element failed", e)
 
 async def click_element_js(element_id: str):
     """Click element using JavaScript instead of mouse simulation."""
@@ -2954,7 +3272,7 @@ async def click_element_js(element_id: str):
         
         return create_success_response(f"Element '{element_id}' clicked using JavaScript")
     except Exception as e:
-        return create_error_response(f"Click element JS failed: {str(e)}")
+        return create_exception_response("Click element JS failed", e)
 
 async def type_text(element_id: str, text: str, clear_first: bool = False, delay: int = 0):
     """Type text into an element."""
@@ -2976,7 +3294,7 @@ async def type_text(element_id: str, text: str, clear_first: bool = False, delay
         
         return create_success_response(f"Successfully typed text into element '{element_id}'")
     except Exception as e:
-        return create_error_response(f"Type text failed: {str(e)}")
+        return create_exception_response("Type text failed", e)
 
 async def clear_text(element_id: str):
     """Clear text from an input element."""
@@ -2990,13 +3308,13 @@ async def clear_text(element_id: str):
         
         return create_success_response(f"Element '{element_id}' cleared successfully")
     except Exception as e:
-        return create_error_response(f"Clear text failed: {str(e)}")
+        return create_exception_response("Clear text failed", e)
 
 async def press_key(key: str, element_id: Optional[str] = None, modifiers: Optional[List[str]] = None):
     """Press a specific key or key combination."""
     try:
         # Convert key string to Key enum if available
-        key_obj = getattr(Key, key.upper()) if hasattr(Key, key.upper()) else key
+        key_obj = _resolve_key(key)
         
         if element_id:
             element = get_element(element_id)
@@ -3004,33 +3322,29 @@ async def press_key(key: str, element_id: Optional[str] = None, modifiers: Optio
                 raise ValueError(f"Element '{element_id}' not found")
             await element.press_keyboard_key(key_obj)
         else:
-            # Page-level key press - use first available tab
-            if not TAB_SESSIONS:
+            # Page-level key press - use the active tab, else the first available one
+            tab = TAB_SESSIONS.get(ACTIVE_TAB_ID) or next(iter(TAB_SESSIONS.values()), None)
+            if tab is None:
                 raise ValueError("No active tabs for page-level key press")
             
-            tab = next(iter(TAB_SESSIONS.values()))
-            
-            # Import required types for key event
-            from pydoll.commands import InputCommands
-            from pydoll.protocol.input.types import KeyEventType
-            
             # Send key down and up events to simulate key press
-            await tab._execute_command(
-                InputCommands.dispatch_key_event(
-                    type=KeyEventType.KEY_DOWN,
-                    key=key_obj if isinstance(key_obj, str) else str(key_obj)
-                )
+            key_name = key_obj if isinstance(key_obj, str) else str(key_obj)
+            key_down_command = InputCommands.dispatch_key_event(
+                type=KeyEventType.KEY_DOWN,
+                key=key_name
             )
-            await tab._execute_command(
-                InputCommands.dispatch_key_event(
-                    type=KeyEventType.KEY_UP,
-                    key=key_obj if isinstance(key_obj, str) else str(key_obj)
-                )
+            key_up_command = {
+                'method': key_down_command['method'],
+                'params': {**key_down_command['params'], 'type': KeyEventType.KEY_UP}
+            }
+            await asyncio.gather(
+                tab._execute_command(key_down_command),
+                tab._execute_command(key_up_command)
             )
         
         return create_success_response(f"Key '{key}' pressed successfully")
     except Exception as e:
-        return create_error_response(f"Press key failed: {str(e)}")
+        return create_exception_response("Press key failed", e)
 
 async def key_down(element_id: str, key: str, modifiers: Optional[List[str]] = None):
     """Press and hold a key (without releasing)."""
@@ -3039,13 +3353,13 @@ async def key_down(element_id: str, key: str, modifiers: Optional[List[str]] = N
         if not element:
             raise ValueError(f"Element '{element_id}' not found")
         
-        key_obj = getattr(Key, key.upper()) if hasattr(Key, key.upper()) else key
+        key_obj = _resolve_key(key)
         
         await element.key_down(key_obj)
         
         return create_success_response(f"Key '{key}' pressed down")
     except Exception as e:
-        return create_error_response(f"Key down failed: {str(e)}")
+        return create_exception_response("Key down failed", e)
 
 async def key_up(element_id: str, key: str):
     """Release a previously pressed key."""
@@ -3054,13 +3368,13 @@ async def key_up(element_id: str, key: str):
         if not element:
             raise ValueError(f"Element '{element_id}' not found")
         
-        key_obj = getattr(Key, key.upper()) if hasattr(Key, key.upper()) else key
+        key_obj = _resolve_key(key)
         
         await element.key_up(key_obj)
         
         return create_success_response(f"Key '{key}' released")
     except Exception as e:
-        return create_error_response(f"Key up failed: {str(e)}")
+        return create_exception_response("Key up failed", e)
 
 async def hover_element(element_id: str):
     """Hover mouse over an element."""
@@ -3074,10 +3388,6 @@ async def hover_element(element_id: str):
         center_x = bounds['x'] + bounds['width'] / 2
         center_y = bounds['y'] + bounds['height'] / 2
         
-        # Import InputCommands and MouseEventType from the connection handler's tab
-        from pydoll.commands import InputCommands
-        from pydoll.protocol.input.types import MouseEventType
-        
         command = InputCommands.dispatch_mouse_event(
             type=MouseEventType.MOUSE_MOVED,
             x=int(center_x),
@@ -3087,7 +3397,7 @@ async def hover_element(element_id: str):
         
         return create_success_response(f"Element '{element_id}' hovered successfully")
     except Exception as e:
-        return create_error_response(f"Hover element failed: {str(e)}")
+        return create_exception_response("Hover element failed", e)
 
 async def scroll_element(
     element_id: str,
@@ -3142,7 +3452,7 @@ async def scroll_element(
         
         return create_success_response(f"Element '{element_id}' scrolled successfully")
     except Exception as e:
-        return create_error_response(f"Scroll element failed: {str(e)}")
+        return create_exception_response("Scroll element failed", e)
 
 async def drag_and_drop(
     source_element_id: str,
@@ -3161,9 +3471,11 @@ async def drag_and_drop(
             raise ValueError(f"Target element '{target_element_id}' not found")
         
         # PyDoll doesn't have built-in drag_and_drop, so simulate with mouse events
-        # Get element positions
-        source_bounds = await source_element.get_bounds_using_js()
-        target_bounds = await target_element.get_bounds_using_js()
+        # Get element positions; the two lookups are independent, so overlap them
+        source_bounds, target_bounds = await asyncio.gather(
+            source_element.get_bounds_using_js(),
+            target_element.get_bounds_using_js()
+        )
         
         if not source_bounds or not target_bounds:
             raise ValueError("Could not get element bounds for drag and drop")
@@ -3173,53 +3485,42 @@ async def drag_and_drop(
         target_x = target_bounds['x'] + target_bounds['width'] / 2  
         target_y = target_bounds['y'] + target_bounds['height'] / 2
         
-        # Simulate drag and drop with mouse events via tab
-        tab = None
-        for tab_session in TAB_SESSIONS.values():
-            if hasattr(tab_session, '_connection_handler') and tab_session._connection_handler == source_element._connection_handler:
-                tab = tab_session
-                break
-        
-        if not tab:
-            raise ValueError("Could not find associated tab for drag and drop")
-            
-        from pydoll.commands import InputCommands
-        from pydoll.protocol.input.types import MouseButton, MouseEventType
-        
-        # Mouse down on source
-        await source_element._execute_command(
-            InputCommands.dispatch_mouse_event(
-                type=MouseEventType.MOUSE_PRESSED,
-                x=source_x,
-                y=source_y,
-                button=MouseButton.LEFT,
-                click_count=1
-            )
-        )
-        
-        # Mouse move to target
-        await source_element._execute_command(
-            InputCommands.dispatch_mouse_event(
-                type=MouseEventType.MOUSE_MOVED,
-                x=target_x,
-                y=target_y
-            )
+        # Build the press command once and derive the move/release events from it
+        press_command = InputCommands.dispatch_mouse_event(
+            type=MouseEventType.MOUSE_PRESSED,
+            x=source_x,
+            y=source_y,
+            button=MouseButton.LEFT,
+            click_count=1
         )
+        press_params = press_command['params']
+        # Interpolate intermediate moves so the drag follows a path instead of jumping
+        move_commands = [
+            {
+                'method': press_command['method'],
+                'params': {
+                    'type': MouseEventType.MOUSE_MOVED,
+                    'x': source_x + (target_x - source_x) * step / DRAG_MOVE_STEPS,
+                    'y': source_y + (target_y - source_y) * step / DRAG_MOVE_STEPS,
+                }
+            }
+            for step in range(1, DRAG_MOVE_STEPS + 1)
+        ]
+        release_command = {
+            'method': press_command['method'],
+            'params': {**press_params, 'type': MouseEventType.MOUSE_RELEASED, 'x': target_x, 'y': target_y}
+        }
         
-        # Mouse up on target
-        await source_element._execute_command(
-            InputCommands.dispatch_mouse_event(
-                type=MouseEventType.MOUSE_RELEASED,
-                x=target_x,
-                y=target_y,
-                button=MouseButton.LEFT,
-                click_count=1
-            )
-        )
+        # CDP processes commands in send order per connection, so press, moves and
+        # release are pipelined rather than waiting a round-trip for each
+        await asyncio.gather(*(
+            source_element._execute_command(command)
+            for command in (press_command, *move_commands, release_command)
+        ))
         
         return create_success_response(f"Drag and drop from '{source_element_id}' to '{target_element_id}' completed")
     except Exception as e:
-        return create_error_response(f"Drag and drop failed: {str(e)}")
+        return create_exception_response("Drag and drop failed", e)
 
 async def get_element_text(element_id: str):
     """Get visible text content of an element."""
@@ -3228,14 +3529,13 @@ async def get_element_text(element_id: str):
         if not element:
             raise ValueError(f"Element '{element_id}' not found")
         
-        # Try different methods to get text
-        text = ""
+        # Fast path: PyDoll's own text property (async, so awaited without a call)
         try:
-            text = await element.text()
-            if text is not None:
-                return create_success_response(str(text))
-        except:
-            pass
+            text = await element.text
+        except (AttributeError, TypeError):
+            text = None
+        if isinstance(text, str):
+            return create_success_response(text)
         
         try:
             # Try getting text content via JavaScript
@@ -3248,7 +3548,7 @@ async def get_element_text(element_id: str):
         # Fallback to empty string
         return create_success_response("")
     except Exception as e:
-        return create_error_response(f"Get element text failed: {str(e)}")
+        return create_exception_response("Get element text failed", e)
 
 async def get_element_attribute(element_id: str, attribute_name: str):
     """Get attribute value from an element."""
@@ -3261,11 +3561,18 @@ async def get_element_attribute(element_id: str, attribute_name: str):
         
         return create_success_response(str(value) if value is not None else "")
     except Exception as e:
-        return create_error_response(f"Get element attribute failed: {str(e)}")
+        return create_exception_response("Get element attribute failed", e)
 
-async def get_element_property(element_id: str, property_name: str):
+async def get_element_property(
+    element_id: str,
+    property_name: Optional[str] = None,
+    property_names: Optional[List[str]] = None
+):
     """
-    Get JavaScript property value from an element.
+    Get JavaScript property value(s) from an element.
+    
+    Pass property_names to read several properties in a single script call; the
+    result is then a JSON object keyed by property name.
     
     QUIRKS & USAGE NOTES:
     =====================
@@ -3319,43 +3626,80 @@ async def get_element_property(element_id: str, property_name: str):
         if not element:
             return create_error_response(f"Element '{element_id}' not found")
         
-        # Find the tab that contains this element
-        tab = None
-        for tab_id, tab_obj in TAB_SESSIONS.items():
-            tab = tab_obj
-            break
+        # Look up the tab that owns this element; elements cached without an owner
+        # fall back to the first open tab
+        tab = TAB_SESSIONS.get(ELEMENT_TO_TAB.get(element_id)) or next(iter(TAB_SESSIONS.values()), None)
             
         if not tab:
             return create_error_response("No active tab found for element property retrieval")
         
-        # Use the same approach as execute_script_on_element
-        script = f"argument.{property_name}"
+        if property_names:
+            names = list(property_names)
+        elif property_name:
+            names = [property_name]
+        else:
+            return create_error_response("Either property_name or property_names is required")
+        batched = property_names is not None
+        
+        # Read every requested property in one script, same approach as execute_script_on_element.
+        # Names that aren't JS property paths (e.g. "data-id") can only be attributes.
+        def read_expression(name):
+            if JS_PROPERTY_PATH.match(name):
+                return f"argument.{name}"
+            return f"argument.getAttribute({json.dumps(name)})"
+        
+        script = "return {" + ", ".join(f"{json.dumps(name)}: {read_expression(name)}" for name in names) + "};"
         
-        # Add return statement if not present (same as execute_script_on_element)
-        if not script.strip().startswith('return'):
-            script = f"return {script}"
+        def format_result(values):
+            if batched:
+                return json.dumps(values, default=str)
+            value = values.get(names[0]) if isinstance(values, dict) else values
+            return _format_script_result(value) if value is not None else ""
         
         # Execute script on the tab with element as argument
         try:
             result = await tab.execute_script(script, element)
-            return create_success_response(str(result) if result is not None else "")
+            return create_success_response(format_result(_script_value(result)))
         except Exception as e:
             # Check if this is a stale element reference
             if "Cannot find context with specified id" in str(e) or "stale element" in str(e).lower():
+                _forget_element(element_id)
                 return create_error_response(f"Element '{element_id}' reference is stale. Please re-find the element using find_element before accessing properties.")
             
-            # Fallback: try to access as an attribute
+            # Only a missing property is worth retrying as an attribute; anything else
+            # would fail the same way on a second round-trip
+            if not any(marker in str(e) for marker in MISSING_PROPERTY_ERRORS):
+                return create_error_response(f"Failed to get property '{', '.join(names)}': {str(e)}")
+            
+            # Fallback: try to access them as attributes, again in a single script
             try:
-                script = f"return argument.getAttribute('{property_name}');"
+                script = (
+                    f"const names = {json.dumps(names)}; const values = {{}};"
+                    " for (const name of names) { values[name] = argument.getAttribute(name); }"
+                    " return values;"
+                )
                 result = await tab.execute_script(script, element)
-                return create_success_response(str(result) if result is not None else "")
+                return create_success_response(format_result(_script_value(result)))
             except Exception as fallback_error:
                 if "Cannot find context with specified id" in str(fallback_error):
+                    _forget_element(element_id)
                     return create_error_response(f"Element '{element_id}' reference is stale. Please re-find the element using find_element before accessing properties.")
-                return create_error_response(f"Failed to get property '{property_name}': {str(e)}, Fallback failed: {str(fallback_error)}")
+                return create_error_response(f"Failed to get property '{', '.join(names)}': {str(e)}, Fallback failed: {str(fallback_error)}")
         
     except Exception as e:
-        return create_error_response(f"Get element property failed: {str(e)}")
+        return create_exception_response("Get element property failed", e)
+
+async def _element_outer_html(element_id: str, element) -> str:
+    """Get an element's outerHTML, reusing a snapshot younger than ELEMENT_STATE_TTL"""
+    now = time.monotonic()
+    cached = ELEMENT_HTML_CACHE.get(element_id)
+    if cached is not None and now - cached[0] < ELEMENT_STATE_TTL:
+        return cached[1]
+    
+    # PyDoll's inner_html is DOM.getOuterHTML, so it already returns the element's own tags
+    html = await element.inner_html
+    ELEMENT_HTML_CACHE[element_id] = (now, html)
+    return html
 
 async def get_element_html(element_id: str, outer_html: bool = False):
     """Get HTML content of an element."""
@@ -3364,14 +3708,18 @@ async def get_element_html(element_id: str, outer_html: bool = False):
         if not element:
             raise ValueError(f"Element '{element_id}' not found")
         
+        outer = await _element_outer_html(element_id, element)
         if outer_html:
-            html = await element.outer_html
-        else:
-            html = await element.inner_html
+            return create_success_response(outer or "")
+        
+        # Derive the inner HTML by stripping the element's own tags from the snapshot;
+        # void elements have no closing tag and no content
+        match = OUTER_HTML_TAGS.match(outer or "")
+        html = match.group(2) if match else ""
         
         return create_success_response(html or "")
     except Exception as e:
-        return create_error_response(f"Get element HTML failed: {str(e)}")
+        return create_exception_response("Get element HTML failed", e)
 
 async def get_element_bounds(element_id: str):
     """Get element position and dimensions."""
@@ -3389,7 +3737,32 @@ async def get_element_bounds_js(element_id: str):
         
         return create_success_response(json.dumps(bounds, indent=2))
     except Exception as e:
-        return create_error_response(f"Get element bounds JS failed: {str(e)}")
+        return create_exception_response("Get element bounds JS failed", e)
+
+async def _element_state(element_id: str, element) -> Dict[str, bool]:
+    """Get all state flags for an element, reusing a result younger than ELEMENT_STATE_TTL"""
+    now = time.monotonic()
+    cached = ELEMENT_STATE_CACHE.get(element_id)
+    if cached is not None and now - cached[0] < ELEMENT_STATE_TTL:
+        return cached[1]
+    
+    result = await element.execute_script(ELEMENT_STATE_SCRIPT, return_by_value=True)
+    state = _script_value(result) or {}
+    ELEMENT_STATE_CACHE[element_id] = (now, state)
+    return state
+
+async def get_element_state(element_id: str):
+    """Get visible/enabled/selected/onTop/interactable flags of an element in one call."""
+    try:
+        element = get_element(element_id)
+        if not element:
+            raise ValueError(f"Element '{element_id}' not found")
+        
+        state = await _element_state(element_id, element)
+        
+        return create_success_response(json.dumps(state))
+    except Exception as e:
+        return create_exception_response("Get element state failed", e)
 
 async def is_element_visible(element_id: str):
     """Check if element is visible on page."""
@@ -3398,11 +3771,11 @@ async def is_element_visible(element_id: str):
         if not element:
             raise ValueError(f"Element '{element_id}' not found")
         
-        visible = await element.is_visible()
+        visible = (await _element_state(element_id, element)).get('visible', False)
         
         return create_success_response(str(visible).lower())
     except Exception as e:
-        return create_error_response(f"Check element visibility failed: {str(e)}")
+        return create_exception_response("Check element visibility failed", e)
 
 async def is_element_enabled(element_id: str):
     """Check if element is enabled for interaction."""
@@ -3415,7 +3788,7 @@ async def is_element_enabled(element_id: str):
         
         return create_success_response(str(enabled).lower())
     except Exception as e:
-        return create_error_response(f"Check element enabled failed: {str(e)}")
+        return create_exception_response("Check element enabled failed", e)
 
 async def is_element_selected(element_id: str):
     """Check if element is selected (checkboxes, radio buttons)."""
@@ -3435,7 +3808,7 @@ async def is_element_selected(element_id: str):
         
         return create_success_response(str(selected).lower())
     except Exception as e:
-        return create_error_response(f"Check element selected failed: {str(e)}")
+        return create_exception_response("Check element selected failed", e)
 
 async def is_element_on_top(element_id: str):
     """Check if element is on top (not covered by other elements)."""
@@ -3444,10 +3817,10 @@ async def is_element_on_top(element_id: str):
         if not element:
             raise ValueError(f"Element '{element_id}' not found")
         
-        result = await element.is_on_top()
+        result = (await _element_state(element_id, element)).get('onTop', False)
         return create_success_response(str(result).lower())
     except Exception as e:
-        return create_error_response(f"Check element on top failed: {str(e)}")
+        return create_exception_response("Check element on top failed", e)
 
 async def is_element_interactable(element_id: str):
     """Check if element is fully interactable (visible, enabled, on top)."""
@@ -3456,10 +3829,10 @@ async def is_element_interactable(element_id: str):
         if not element:
             raise ValueError(f"Element '{element_id}' not found")
         
-        result = await element.is_interactable()
+        result = (await _element_state(element_id, element)).get('interactable', False)
         return create_success_response(str(result).lower())
     except Exception as e:
-        return create_error_response(f"Check element interactable failed: {str(e)}")
+        return create_exception_response("Check element interactable failed", e)
 
 async def get_parent_element(element_id: str, parent_element_id: str):
     """Get parent element of specified element."""
@@ -3472,11 +3845,11 @@ async def get_parent_element(element_id: str, parent_element_id: str):
             raise ValueError(f"Parent element ID '{parent_element_id}' already exists")
         
         parent = await element.get_parent_element()
-        ELEMENT_CACHE[parent_element_id] = parent
+        _cache_set(parent_element_id, parent, ELEMENT_TO_TAB.get(element_id))
         
         return create_success_response(f"Parent element stored as '{parent_element_id}'")
     except Exception as e:
-        return create_error_response(f"Get parent element failed: {str(e)}")
+        return create_exception_response("Get parent element failed", e)
 
 async def get_child_elements(element_id: str, base_child_id: str, selector: Optional[str] = None):
     """Get child elements of specified element."""
@@ -3493,12 +3866,12 @@ async def get_child_elements(element_id: str, base_child_id: str, selector: Opti
         child_ids = []
         for i, child in enumerate(children):
             child_id = f"{base_child_id}_{i}"
-            ELEMENT_CACHE[child_id] = child
+            _cache_set(child_id, child, ELEMENT_TO_TAB.get(element_id))
             child_ids.append(child_id)
         
         return create_success_response(f"Found {len(child_ids)} child elements: {', '.join(child_ids)}")
     except Exception as e:
-        return create_error_response(f"Get child elements failed: {str(e)}")
+        return create_exception_response("Get child elements failed", e)
 
 async def get_sibling_elements(
     element_id: str,
@@ -3518,12 +3891,12 @@ async def get_sibling_elements(
         sibling_ids = []
         for i, sibling in enumerate(siblings):
             sibling_id = f"{base_sibling_id}_{i}"
-            ELEMENT_CACHE[sibling_id] = sibling
+            _cache_set(sibling_id, sibling, ELEMENT_TO_TAB.get(element_id))
             sibling_ids.append(sibling_id)
         
         return create_success_response(f"Found {len(sibling_ids)} sibling elements: {', '.join(sibling_ids)}")
     except Exception as e:
-        return create_error_response(f"Get sibling elements failed: {str(e)}")
+        return create_exception_response("Get sibling elements failed", e)
 
 async def element_wait_until(
     element_id: str,
@@ -3567,7 +3940,7 @@ async def element_wait_until(
         
         return create_success_response(f"Element conditions met: {', '.join(conditions)}")
     except Exception as e:
-        return create_error_response(f"Element wait until failed: {str(e)}")
+        return create_exception_response("Element wait until failed", e)
 
 async def wait_for_element(
     tab_id: str,
@@ -3610,42 +3983,19 @@ async def wait_for_element(
     wait_for_element(tab_id, 'css', '#delayed-element', timeout=5)
     """
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
-        selector_map = {
-            "css": By.CSS_SELECTOR,
-            "xpath": By.XPATH,
-            "id": By.ID,
-            "name": By.NAME,
-            "tag": By.TAG_NAME,
-            "class": By.CLASS_NAME
-        }
-        
-        if selector_type not in selector_map:
+        selector_type = selector_type.lower()
+        if selector_type not in SELECTOR_DISPATCH:
             raise ValueError(f"Invalid selector type: {selector_type}")
         
-        by_type = selector_map[selector_type]
+        # One deadline covers PyDoll's waiting find and both fallbacks
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
         
-        # Use PyDoll's built-in find_or_wait_element method
+        # Use PyDoll's built-in waiting find through the shared selector dispatch
         try:
-            # Map selector types to find method parameters
-            if selector_type.lower() == "css":
-                element = await tab.find(css=selector_value, timeout=int(timeout))
-            elif selector_type.lower() == "xpath":
-                element = await tab.find(xpath=selector_value, timeout=int(timeout))
-            elif selector_type.lower() == "id":
-                element = await tab.find(id=selector_value, timeout=int(timeout))
-            elif selector_type.lower() == "name":
-                element = await tab.find(name=selector_value, timeout=int(timeout))
-            elif selector_type.lower() == "tag":
-                element = await tab.find(tag_name=selector_value, timeout=int(timeout))
-            elif selector_type.lower() == "class":
-                element = await tab.find(class_name=selector_value, timeout=int(timeout))
-            else:
-                # Fallback to find_or_wait_element for other types
-                element = await tab.find_or_wait_element(by_type, selector_value, timeout=int(timeout))
+            element = await _dispatch_selector(tab, selector_type, selector_value, timeout=int(timeout))
             
             if element:
                 # Check visibility if required
@@ -3660,28 +4010,44 @@ async def wait_for_element(
                 
                 return create_success_response(f"Element found with selector '{selector_value}'")
             else:
-                raise TimeoutError(f"Timed out waiting for element to appear")
+                raise TimeoutError("Timed out waiting for element to appear")
                 
         except Exception as wait_error:
-            # If PyDoll methods fail, fall back to manual polling
-            import asyncio
-            import time
+            # If PyDoll methods fail, let the page resolve a promise as soon as a DOM
+            # mutation makes the selector match instead of polling from Python
+            remaining = max(0, deadline - loop.time())
+            observer_script = WAIT_FOR_SELECTOR_SCRIPT % (
+                WAIT_FOR_SELECTOR_JS[selector_type] % json.dumps(selector_value),
+                int(remaining * 1000)
+            )
+            try:
+                found = await _evaluate_promise(tab, observer_script, remaining)
+                if found:
+                    return create_success_response(f"Element found with selector '{selector_value}'")
+                if found is False:
+                    raise TimeoutError("Timed out waiting for element to appear")
+            except TimeoutError:
+                raise
+            except Exception:
+                pass
             
-            start_time = time.time()
-            while time.time() - start_time < timeout:
+            # No MutationObserver (or the script failed): poll with exponential backoff
+            delay = 0.05
+            while loop.time() < deadline:
                 try:
                     # Try to find the element using basic find_elements
-                    elements = await tab.find_elements(by_type, selector_value)
+                    elements = await _dispatch_selector(tab, selector_type, selector_value, find_all=True)
                     if elements:
                         return create_success_response(f"Element found with selector '{selector_value}'")
                 except:
                     pass
                 
-                await asyncio.sleep(0.5)
+                await asyncio.sleep(min(delay, max(0, deadline - loop.time())))
+                delay = min(delay * 2, 1.0)
             
-            raise TimeoutError(f"Timed out waiting for element to appear")
+            raise TimeoutError("Timed out waiting for element to appear")
     except Exception as e:
-        return create_error_response(f"Wait for element failed: {str(e)}")
+        return create_exception_response("Wait for element failed", e)
 
 async def execute_script(tab_id: str, script: str, args: Optional[List] = None):
     """
@@ -3734,18 +4100,16 @@ async def execute_script(tab_id: str, script: str, args: Optional[List] = None):
     Use console.log() for debugging instead of alert().
     """
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         if args:
             result = await tab.execute_script(script, *args)
         else:
             result = await tab.execute_script(script)
         
-        return create_success_response(str(result) if result is not None else "null")
+        return create_success_response(_format_script_result(result))
     except Exception as e:
-        return create_error_response(f"Execute script failed: {str(e)}")
+        return create_exception_response("Execute script failed", e)
 
 async def execute_script_on_element(tab_id: str, element_id: str, script: str, args: Optional[List] = None):
     """Execute JavaScript with element as context.
@@ -3758,82 +4122,80 @@ async def execute_script_on_element(tab_id: str, element_id: str, script: str, a
         if not element:
             raise ValueError(f"Element '{element_id}' not found")
         
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         # Convert arguments[0] to argument for PyDoll compatibility  
         processed_script = script.replace('arguments[0]', 'argument')
         
         # Add return statement if not present
-        if not processed_script.strip().startswith('return'):
+        if not SCRIPT_RETURN_PREFIX.match(processed_script):
             processed_script = f"return {processed_script}"
         
         # Execute script on the tab with element as first argument
         result = await tab.execute_script(processed_script, element)
 
-        return create_success_response(str(result) if result is not None else "null")
+        return create_success_response(_format_script_result(result))
     except Exception as e:
-        return create_error_response(f"Execute script on element failed: {str(e)}")
+        return create_exception_response("Execute script on element failed", e)
+
+async def _page_state(tab_id: str, tab, key: str, compute: Callable):
+    """Return a page value for the tab, reusing a reading younger than PAGE_STATE_TTL"""
+    now = time.monotonic()
+    cached = PAGE_STATE_CACHE.get(tab_id, {}).get(key)
+    if cached is not None and now - cached[0] < PAGE_STATE_TTL:
+        return cached[1]
+    
+    value = await compute()
+    PAGE_STATE_CACHE.setdefault(tab_id, {})[key] = (now, value)
+    return value
 
 async def get_page_title(tab_id: str):
     """Get the current page title."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
-        result = await tab.execute_script("return document.title;")
+        result = await _page_state(tab_id, tab, "title", lambda: tab.execute_script("return document.title;"))
         
-        # Handle different response formats
-        title = ""
-        if hasattr(result, 'result'):
-            if hasattr(result.result, 'value'):
-                title = result.result.value
-            else:
-                title = str(result.result)
-        elif isinstance(result, dict) and 'result' in result:
-            if isinstance(result['result'], dict) and 'value' in result['result']:
-                title = result['result']['value']
-            else:
-                title = str(result['result'])
-        else:
-            title = str(result)
+        title = _unwrap_cdp_value(result)
         
         return create_success_response(title or "")
     except Exception as e:
-        return create_error_response(f"Get page title failed: {str(e)}")
+        return create_exception_response("Get page title failed", e)
 
 async def get_page_url(tab_id: str):
     """Get the current page URL."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
-        url = await tab.current_url
+        url = await _page_state(tab_id, tab, "url", lambda: tab.current_url)
         
         return create_success_response(url or "")
     except Exception as e:
-        return create_error_response(f"Get page URL failed: {str(e)}")
+        return create_exception_response("Get page URL failed", e)
 
-async def get_page_source(tab_id: str):
+async def get_page_source(tab_id: str, max_chars: int = 20000):
     """Get the current page HTML source."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
+        
+        # Limit response size to prevent token overflow (max ~20k chars for safety).
+        # Slice in the page so only max_chars + 1 characters cross the websocket;
+        # the extra character tells us whether anything was cut.
+        async def read_source():
+            result = await tab.execute_script(
+                f"return document.documentElement.outerHTML.slice(0, {int(max_chars) + 1});"
+            )
+            return _script_value(result)
         
-        source = await tab.page_source
+        source = await _page_state(tab_id, tab, f"source:{max_chars}", read_source)
         
-        # Limit response size to prevent token overflow (max ~20k chars for safety)
-        if source and len(source) > 20000:
-            truncated_source = source[:20000] + "\n\n... [Response truncated due to size limit]"
+        if source and len(source) > max_chars:
+            truncated_source = source[:max_chars] + "\n\n... [Response truncated due to size limit]"
             return create_success_response(truncated_source)
         
         return create_success_response(source or "")
     except Exception as e:
-        return create_error_response(f"Get page source failed: {str(e)}")
+        return create_exception_response("Get page source failed", e)
 
 async def take_screenshot(
     tab_id: str,
@@ -3845,9 +4207,7 @@ async def take_screenshot(
 ):
     """Take screenshot of page or element."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         if save_path:
             # Save directly to file
@@ -3867,13 +4227,22 @@ async def take_screenshot(
                 element = get_element(element_id)
                 if not element:
                     raise ValueError(f"Element '{element_id}' not found")
-                import tempfile
-                import os
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    await element.take_screenshot(tmp.name)
-                    with open(tmp.name, 'rb') as f:
-                        screenshot_data = base64.b64encode(f.read()).decode('utf-8')
-                    os.unlink(tmp.name)
+                # Capture the element's clip directly; CDP already returns base64 data
+                bounds = await element.get_bounds_using_js()
+                image_format = "jpeg" if format == "jpg" else format
+                command = PageCommands.capture_screenshot(
+                    format=image_format,
+                    quality=None if image_format == "png" else quality,
+                    clip={
+                        "x": bounds['x'],
+                        "y": bounds['y'],
+                        "width": bounds['width'],
+                        "height": bounds['height'],
+                        "scale": 1
+                    }
+                )
+                screenshot = await element._connection_handler.execute_command(command)
+                screenshot_data = screenshot['result']['data']
             else:
                 screenshot_data = await tab.take_screenshot(as_base64=True, beyond_viewport=full_page)
             
@@ -3886,7 +4255,7 @@ async def take_screenshot(
             
             return create_success_response_with_image(screenshot_b64, f"image/{format}")
     except Exception as e:
-        return create_error_response(f"Take screenshot failed: {str(e)}")
+        return create_exception_response("Take screenshot failed", e)
 
 async def save_pdf(
     tab_id: str,
@@ -3897,20 +4266,37 @@ async def save_pdf(
 ):
     """Save page as PDF document."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
-        
-        await tab.print_to_pdf(
-            path=file_path,
-            landscape=landscape,
-            print_background=print_background,
-            scale=scale
+        tab = require_tab(tab_id)
+        
+        # Stream the PDF to disk in chunks instead of receiving it as one base64 blob
+        response = await tab._execute_command(
+            PageCommands.print_to_pdf(
+                landscape=landscape,
+                print_background=print_background,
+                scale=scale,
+                transfer_mode="ReturnAsStream"
+            )
         )
+        stream_handle = response['result']['stream']
+        
+        try:
+            with open(file_path, 'wb') as pdf_file:
+                while True:
+                    chunk = await tab._execute_command({
+                        "method": "IO.read",
+                        "params": {"handle": stream_handle, "size": PDF_STREAM_CHUNK_SIZE}
+                    })
+                    chunk_result = chunk['result']
+                    data = chunk_result.get('data', '')
+                    pdf_file.write(base64.b64decode(data) if chunk_result.get('base64Encoded') else data.encode())
+                    if chunk_result.get('eof'):
+                        break
+        finally:
+            await tab._execute_command({"method": "IO.close", "params": {"handle": stream_handle}})
         
         return create_success_response(f"PDF saved to: {file_path}")
     except Exception as e:
-        return create_error_response(f"Save PDF failed: {str(e)}")
+        return create_exception_response("Save PDF failed", e)
 
 async def make_request(
     tab_id: str,
@@ -3928,11 +4314,14 @@ async def make_request(
                 e.g., [{"name": "Content-Type", "value": "application/json"}]
     """
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
+        
+        method = method.upper()
+        if method not in SUPPORTED_HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
-        # Use tab's request object
+        # The tab's request object is created once per tab and issues fetch() from the
+        # page, so the browser's own keep-alive pool and cookies are reused across calls
         request_obj = tab.request
         
         # Build request parameters
@@ -3949,23 +4338,7 @@ async def make_request(
         elif data:
             kwargs["data"] = data
         
-        # Make request based on method
-        if method.upper() == "GET":
-            response = await request_obj.get(url, **kwargs)
-        elif method.upper() == "POST":
-            response = await request_obj.post(url, **kwargs)
-        elif method.upper() == "PUT":
-            response = await request_obj.put(url, **kwargs)
-        elif method.upper() == "DELETE":
-            response = await request_obj.delete(url, **kwargs)
-        elif method.upper() == "HEAD":
-            response = await request_obj.head(url, **kwargs)
-        elif method.upper() == "OPTIONS":
-            response = await request_obj.options(url, **kwargs)
-        elif method.upper() == "PATCH":
-            response = await request_obj.patch(url, **kwargs)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+        response = await request_obj.request(method, url, **kwargs)
         
         result = {
             "status_code": response.status_code,
@@ -3976,27 +4349,27 @@ async def make_request(
         
         return create_success_response(json.dumps(result, indent=2))
     except Exception as e:
-        return create_error_response(f"Make request failed: {str(e)}")
+        return create_exception_response("Make request failed", e)
 
 async def set_cookies(tab_id: str, cookies: List[Dict[str, Any]]):
     """Set cookies for current domain."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         await tab.set_cookies(cookies)
         
         return create_success_response(f"Successfully set {len(cookies)} cookies")
     except Exception as e:
-        return create_error_response(f"Set cookies failed: {str(e)}")
+        return create_exception_response("Set cookies failed", e)
+
+def _cookie_matches(cookie_domain: str, netlocs: List[str]) -> bool:
+    """Check whether a cookie domain belongs to any of the given hosts"""
+    return any(cookie_domain in netloc for netloc in netlocs)
 
 async def get_cookies(tab_id: str, urls: Optional[List[str]] = None):
     """Get cookies from current domain or specific URLs."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         # PyDoll's get_cookies doesn't support urls parameter directly
         # Get all cookies first
@@ -4004,58 +4377,47 @@ async def get_cookies(tab_id: str, urls: Optional[List[str]] = None):
         
         # Filter by URLs if specified
         if urls:
-            filtered_cookies = []
-            for cookie in cookies:
-                for url in urls:
-                    import urllib.parse
-                    try:
-                        parsed = urllib.parse.urlparse(url)
-                        cookie_domain = cookie.get('domain', '').lstrip('.')
-                        if (cookie_domain in parsed.netloc or 
-                            parsed.netloc.endswith(cookie_domain) or
-                            cookie_domain == parsed.netloc):
-                            filtered_cookies.append(cookie)
-                            break
-                    except:
-                        continue
-            cookies = filtered_cookies
+            # Parse each URL once, then make a single pass over the cookies
+            netlocs = []
+            for url in urls:
+                try:
+                    netlocs.append(urllib.parse.urlparse(url).netloc)
+                except ValueError:
+                    continue
+            cookies = [
+                cookie for cookie in cookies
+                if _cookie_matches(cookie.get('domain', '').lstrip('.'), netlocs)
+            ]
         
         return create_success_response(json.dumps(cookies, indent=2))
     except Exception as e:
-        return create_error_response(f"Get cookies failed: {str(e)}")
+        return create_exception_response("Get cookies failed", e)
 
 async def delete_cookies(
     tab_id: str,
     name: Optional[str] = None,
     url: Optional[str] = None,
     domain: Optional[str] = None,
-    path: Optional[str] = None
+    path: Optional[str] = None,
+    names: Optional[List[str]] = None
 ):
     """Delete specific cookies or all cookies."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
-        kwargs = {}
-        if name:
-            kwargs["name"] = name
-        if url:
-            kwargs["url"] = url
-        if domain:
-            kwargs["domain"] = domain
-        if path:
-            kwargs["path"] = path
+        cookie_names = ([name] if name else []) + list(names or [])
         
         # Use NetworkCommands for cookie deletion
-        from pydoll.commands import NetworkCommands
-        if name:
-            # Delete specific cookie by name
-            await tab._execute_command(NetworkCommands.delete_cookies(
-                name=name,
-                url=url,
-                domain=domain, 
-                path=path
+        if cookie_names:
+            # Delete specific cookies by name; the commands are independent, so send them together
+            await asyncio.gather(*(
+                tab._execute_command(NetworkCommands.delete_cookies(
+                    name=cookie_name,
+                    url=url,
+                    domain=domain,
+                    path=path
+                ))
+                for cookie_name in cookie_names
             ))
         else:
             # Clear all cookies if no name specified
@@ -4063,7 +4425,37 @@ async def delete_cookies(
         
         return create_success_response("Cookies deleted successfully")
     except Exception as e:
-        return create_error_response(f"Delete cookies failed: {str(e)}")
+        return create_exception_response("Delete cookies failed", e)
+
+def _missing_files(file_paths: List[str]) -> Set[str]:
+    """Return the paths that don't exist, listing each shared parent directory once instead of stat-ing every file"""
+    by_dir: Dict[str, List[str]] = {}
+    for path in file_paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+    
+    missing = set()
+    for directory, paths in by_dir.items():
+        present = set()
+        if len(paths) > 1:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    present = {entry.name for entry in entries if not entry.is_symlink()}
+            except OSError:
+                pass
+        # Anything not in the listing (lone files, symlinks, case-insensitive names) gets a real stat
+        missing.update(p for p in paths if os.path.basename(p) not in present and not os.path.exists(p))
+    return missing
+
+async def _require_files_exist(file_paths: List[str]):
+    """Raise FileNotFoundError for the first missing path, checking them off the event loop"""
+    if len(file_paths) == 1:
+        # A single stat isn't worth a thread hop
+        missing = _missing_files(file_paths)
+    else:
+        missing = await asyncio.to_thread(_missing_files, file_paths)
+    for file_path in file_paths:
+        if file_path in missing:
+            raise FileNotFoundError(f"File not found: {file_path}")
 
 async def upload_file(element_id: str, file_paths: List[str]):
     """
@@ -4117,15 +4509,19 @@ async def upload_file(element_id: str, file_paths: List[str]):
             raise ValueError(f"Element '{element_id}' not found")
         
         # Verify all files exist
-        for file_path in file_paths:
-            if not Path(file_path).exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
+        await _require_files_exist(file_paths)
         
         await element.set_input_files(file_paths)
         
         return create_success_response(f"Successfully uploaded {len(file_paths)} files")
     except Exception as e:
-        return create_error_response(f"Upload file failed: {str(e)}")
+        return create_exception_response("Upload file failed", e)
+
+def _write_download(file_path: Path, content: bytes):
+    """Write downloaded bytes to disk, creating the parent directory if needed"""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'wb') as f:
+        f.write(content)
 
 async def download_file(
     tab_id: str,
@@ -4137,9 +4533,7 @@ async def download_file(
 ):
     """Download files from URLs."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         # Use tab's request object to download
         response = await tab.request.get(url, timeout=timeout)
@@ -4158,71 +4552,107 @@ async def download_file(
             
             file_path = Path(directory) / filename
         
-        # Write file
-        with open(file_path, 'wb') as f:
-            f.write(response.content)
+        # PyDoll hands back the whole body at once (it comes from an in-page fetch), so
+        # streaming isn't available; at least keep the disk write off the event loop
+        await asyncio.to_thread(_write_download, file_path, response.content)
         
         return create_success_response(f"File downloaded to: {file_path}")
     except Exception as e:
-        return create_error_response(f"Download file failed: {str(e)}")
+        return create_exception_response("Download file failed", e)
+
+async def download_files(
+    tab_id: str,
+    urls: List[str],
+    directory: Optional[str] = None,
+    concurrency: int = 4,
+    timeout: int = 300
+):
+    """Download several URLs concurrently, at most `concurrency` at a time."""
+    try:
+        require_tab(tab_id)
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        
+        # Name every file up front so URLs ending in the same name don't overwrite each other
+        filenames = []
+        taken: Set[str] = set()
+        for url in urls:
+            filename = url.split('/')[-1] or 'download'
+            stem, suffix = Path(filename).stem, Path(filename).suffix
+            copy = 1
+            while filename in taken:
+                filename = f"{stem}-{copy}{suffix}"
+                copy += 1
+            taken.add(filename)
+            filenames.append(filename)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def download_one(url: str, filename: str):
+            async with semaphore:
+                return await download_file(tab_id, url, filename=filename, directory=directory, timeout=timeout)
+        
+        # download_file reports failures in its response rather than raising, so one bad URL
+        # doesn't cancel the rest
+        responses = await asyncio.gather(
+            *(download_one(url, filename) for url, filename in zip(urls, filenames, strict=True))
+        )
+        results = [
+            {"url": url, "result": response["content"][0]["text"]}
+            for url, response in zip(urls, responses, strict=True)
+        ]
+        
+        return create_json_response(results)
+    except Exception as e:
+        return create_exception_response("Download files failed", e)
 
 async def expect_file_chooser(tab_id: str, file_paths: List[str], timeout: float = 30):
     """Handle file chooser dialogs with automatic file selection."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         # Verify files exist
-        for file_path in file_paths:
-            if not Path(file_path).exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
+        await _require_files_exist(file_paths)
         
         async with tab.expect_file_chooser(file_paths):
             pass  # File paths are automatically handled by the context manager
         
         return create_success_response(f"File chooser handled with {len(file_paths)} files")
     except Exception as e:
-        return create_error_response(f"Expect file chooser failed: {str(e)}")
+        return create_exception_response("Expect file chooser failed", e)
 
 async def enable_file_chooser_intercept(tab_id: str):
     """Enable file chooser dialog interception."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         await tab.enable_intercept_file_chooser_dialog()
         
         return create_success_response("File chooser interception enabled")
     except Exception as e:
-        return create_error_response(f"Enable file chooser intercept failed: {str(e)}")
+        return create_exception_response("Enable file chooser intercept failed", e)
 
 async def disable_file_chooser_intercept(tab_id: str):
     """Disable file chooser dialog interception."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         await tab.disable_intercept_file_chooser_dialog()
         
         return create_success_response("File chooser interception disabled")
     except Exception as e:
-        return create_error_response(f"Disable file chooser intercept failed: {str(e)}")
+        return create_exception_response("Disable file chooser intercept failed", e)
 
 async def wait_for_page_load(tab_id: str, wait_until: str = "load", timeout: int = 30):
     """Wait for page to finish loading."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         await tab._wait_page_load(timeout=timeout)
         
         return create_success_response(f"Page load completed ({wait_until})")
     except Exception as e:
-        return create_error_response(f"Wait for page load failed: {str(e)}")
+        return create_exception_response("Wait for page load failed", e)
 
 async def wait_for_function(
     tab_id: str,
@@ -4233,15 +4663,31 @@ async def wait_for_function(
 ):
     """Wait for JavaScript function to return truthy value."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
-        
-        import asyncio
-        import time
-        
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        tab = require_tab(tab_id)
+        
+        # Poll inside the page: one Runtime.evaluate whose promise settles when the
+        # function turns truthy or the deadline passes, instead of a CDP call per tick
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        body = script.strip().rstrip(';')
+        if not JS_RETURN_STATEMENT.search(body):
+            body = f"return ({body});"
+        wrapped = WAIT_FOR_FUNCTION_SCRIPT % (body, json.dumps(args or []), int(timeout * 1000), int(polling))
+        try:
+            outcome = await _evaluate_promise(tab, wrapped, timeout)
+        except asyncio.TimeoutError:
+            raise
+        except Exception:
+            outcome = None
+        if isinstance(outcome, dict):
+            if outcome.get('timedOut'):
+                raise TimeoutError(f"Function did not return truthy value within {timeout} seconds")
+            if outcome.get('value'):
+                return create_success_response(f"Function returned truthy value: {outcome['value']}")
+        
+        # The in-page wait couldn't run (e.g. the script didn't parse inside the wrapper):
+        # poll from here for whatever is left of the caller's timeout
+        while loop.time() < deadline:
             try:
                 # Execute the script and check result
                 if args:
@@ -4249,20 +4695,7 @@ async def wait_for_function(
                 else:
                     result = await tab.execute_script(script)
                 
-                # Handle different response formats
-                value = None
-                if hasattr(result, 'result'):
-                    if hasattr(result.result, 'value'):
-                        value = result.result.value
-                    else:
-                        value = result.result
-                elif isinstance(result, dict) and 'result' in result:
-                    if isinstance(result['result'], dict) and 'value' in result['result']:
-                        value = result['result']['value']
-                    else:
-                        value = result['result']
-                else:
-                    value = result
+                value = _unwrap_cdp_value(result)
                 
                 # Check if value is truthy
                 if value:
@@ -4272,14 +4705,14 @@ async def wait_for_function(
                 # Continue polling on execution errors
                 pass
             
-            await asyncio.sleep(polling / 1000.0)  # Convert ms to seconds
+            await asyncio.sleep(min(polling / 1000.0, max(0, deadline - loop.time())))  # Convert ms to seconds
         
         raise TimeoutError(f"Function did not return truthy value within {timeout} seconds")
         
     except asyncio.TimeoutError:
         return create_error_response(f"Function did not return truthy value within {timeout} seconds")
     except Exception as e:
-        return create_error_response(f"Wait for function failed: {str(e)}")
+        return create_exception_response("Wait for function failed", e)
 
 
 async def handle_alert(tab_id: str, action: str = "accept", text: Optional[str] = None):
@@ -4336,9 +4769,7 @@ async def handle_alert(tab_id: str, action: str = "accept", text: Optional[str]
     handle_alert(tab_id, action="accept", text="John Doe")
     """
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         if action == "accept":
             await tab.handle_dialog(accept=True, prompt_text=text)
@@ -4346,55 +4777,41 @@ async def handle_alert(tab_id: str, action: str = "accept", text: Optional[str]
             await tab.handle_dialog(accept=False)
         else:
             raise ValueError(f"Invalid action: {action}")
+        LAST_DIALOG.pop(tab_id, None)
         
         return create_success_response(f"Dialog {action}ed successfully")
     except Exception as e:
-        return create_error_response(f"Handle alert failed: {str(e)}")
+        return create_exception_response("Handle alert failed", e)
 
 async def has_dialog(tab_id: str):
     """Check if there is an active dialog on the page."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         has_dialog = await tab.has_dialog()
         
         return create_success_response(str(has_dialog).lower())
     except Exception as e:
-        return create_error_response(f"Check has dialog failed: {str(e)}")
+        return create_exception_response("Check has dialog failed", e)
 
 async def get_dialog_message(tab_id: str):
     """Get the message text from an active dialog."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
-        # Check event logs for dialog information
-        if tab_id in EVENT_LOGS:
-            for event in reversed(EVENT_LOGS[tab_id]):
-                if event.get('event_type') == 'Page.javascriptDialogOpening':
-                    if 'data' in event and 'params' in event['data']:
-                        return create_success_response(event['data']['params'].get('message', ''))
+        # Recorded by register_event_callback when a dialog-opening callback is registered
+        if tab_id in LAST_DIALOG:
+            return create_success_response(LAST_DIALOG[tab_id])
         
         # Fallback - try to get message via JavaScript if dialog still active
         try:
             result = await tab.execute_script("return window.lastDialogMessage || 'Dialog message not available';")
             
-            message = ""
-            if hasattr(result, 'result') and hasattr(result.result, 'value'):
-                message = result.result.value
-            elif isinstance(result, dict) and 'result' in result:
-                message = result['result'].get('value', str(result['result']))
-            else:
-                message = str(result)
-                
-            return create_success_response(message)
+            return create_success_response(_unwrap_cdp_value(result))
         except:
             return create_success_response("Dialog message not available")
     except Exception as e:
-        return create_error_response(f"Get dialog message failed: {str(e)}")
+        return create_exception_response("Get dialog message failed", e)
 
 # === EVENT SYSTEM IMPLEMENTATIONS ===
 
@@ -4405,18 +4822,18 @@ async def enable_page_events(tab_id: str):
     Handle any active dialogs first using handle_alert().
     """
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
+        if tab.page_events_enabled:
+            return create_success_response("Page events already enabled")
         await tab.enable_page_events()
         
         return create_success_response("Page events enabled successfully")
     except Exception as e:
         error_msg = str(e).lower()
         if "timeout" in error_msg or "blocked" in error_msg:
-            return create_error_response(f"Enable page events failed: Browser tab may be blocked by a dialog. Try handling any active dialogs first with handle_alert(), then retry. Original error: {str(e)}")
-        return create_error_response(f"Enable page events failed: {str(e)}")
+            return create_exception_response("Enable page events failed: Browser tab may be blocked by a dialog. Try handling any active dialogs first with handle_alert(), then retry. Original error", e)
+        return create_exception_response("Enable page events failed", e)
 
 async def enable_network_events(tab_id: str):
     """Enable network event monitoring.
@@ -4425,28 +4842,26 @@ async def enable_network_events(tab_id: str):
     Handle any active dialogs first using handle_alert().
     """
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
-        
-        await tab.enable_network_events()
+        tab = require_tab(tab_id)
         
         if tab_id not in NETWORK_LOGS:
-            NETWORK_LOGS[tab_id] = []
+            NETWORK_LOGS[tab_id] = _new_log()
+        
+        if tab.network_events_enabled:
+            return create_success_response("Network events already enabled")
+        await tab.enable_network_events()
         
         return create_success_response("Network events enabled successfully")
     except Exception as e:
         error_msg = str(e).lower()
         if "timeout" in error_msg or "blocked" in error_msg:
-            return create_error_response(f"Enable network events failed: Browser tab may be blocked by a dialog. Try handling any active dialogs first with handle_alert(), then retry. Original error: {str(e)}")
-        return create_error_response(f"Enable network events failed: {str(e)}")
+            return create_exception_response("Enable network events failed: Browser tab may be blocked by a dialog. Try handling any active dialogs first with handle_alert(), then retry. Original error", e)
+        return create_exception_response("Enable network events failed", e)
 
 async def enable_fetch_events(tab_id: str, patterns: Optional[List[str]] = None):
     """Enable fetch event monitoring for request interception."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         if patterns:
             await tab.enable_fetch_events(patterns=patterns)
@@ -4455,59 +4870,79 @@ async def enable_fetch_events(tab_id: str, patterns: Optional[List[str]] = None)
         
         return create_success_response(f"Fetch events enabled for {len(patterns) if patterns else 'all'} patterns")
     except Exception as e:
-        return create_error_response(f"Enable fetch events failed: {str(e)}")
+        return create_exception_response("Enable fetch events failed", e)
 
 async def enable_dom_events(tab_id: str):
     """Enable DOM event monitoring."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
+        if tab.dom_events_enabled:
+            return create_success_response("DOM events already enabled")
         await tab.enable_dom_events()
         
         return create_success_response("DOM events enabled successfully")
     except Exception as e:
-        return create_error_response(f"Enable DOM events failed: {str(e)}")
+        return create_exception_response("Enable DOM events failed", e)
 
 async def enable_runtime_events(tab_id: str):
     """Enable runtime event monitoring."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
+        if tab.runtime_events_enabled:
+            return create_success_response("Runtime events already enabled")
         await tab.enable_runtime_events()
         
         return create_success_response("Runtime events enabled successfully")
     except Exception as e:
-        return create_error_response(f"Enable runtime events failed: {str(e)}")
+        return create_exception_response("Enable runtime events failed", e)
 
 async def disable_all_events(tab_id: str):
     """Disable all event monitoring for a tab."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
-        await tab.disable_page_events()
-        await tab.disable_network_events()
-        await tab.disable_fetch_events()
-        await tab.disable_dom_events()
-        await tab.disable_runtime_events()
+        # The disables are independent CDP round-trips; one failing shouldn't keep the rest enabled
+        domains = ("page", "network", "fetch", "dom", "runtime")
+        results = await asyncio.gather(
+            *(getattr(tab, f"disable_{domain}_events")() for domain in domains),
+            return_exceptions=True
+        )
+        for domain, result in zip(domains, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("Failed to disable %s events for tab %s: %s", domain, tab_id, result)
         
         await tab.clear_callbacks()
         
         if tab_id in EVENT_CALLBACKS:
             EVENT_CALLBACKS[tab_id] = {}
         if tab_id in EVENT_LOGS:
-            EVENT_LOGS[tab_id] = []
+            EVENT_LOGS[tab_id].clear()
+        LAST_DIALOG.pop(tab_id, None)
         if tab_id in NETWORK_LOGS:
-            NETWORK_LOGS[tab_id] = []
+            NETWORK_LOGS[tab_id].clear()
         
         return create_success_response("All event monitoring disabled")
     except Exception as e:
-        return create_error_response(f"Disable all events failed: {str(e)}")
+        return create_exception_response("Disable all events failed", e)
+
+def _event_url(event_data: Any) -> str:
+    """Best-effort URL of a CDP event, from its params or the request/response/frame it describes"""
+    params = event_data.get('params') if isinstance(event_data, dict) else None
+    if not isinstance(params, dict):
+        return ''
+    for holder in (params, params.get('request'), params.get('response'), params.get('frame')):
+        if isinstance(holder, dict) and 'url' in holder:
+            return str(holder['url'])
+    return ''
+
+@functools.lru_cache(maxsize=128)
+def _compile_url_glob(pattern: str) -> Pattern:
+    """Compile a URL glob such as '*.json'; a pattern without wildcards matches as a substring"""
+    if not any(c in pattern for c in "*?["):
+        pattern = f"*{pattern}*"
+    return re.compile(fnmatch.translate(pattern))
 
 async def register_event_callback(
     tab_id: str,
@@ -4517,74 +4952,77 @@ async def register_event_callback(
 ):
     """Register callback for specific browser events."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         if tab_id not in EVENT_CALLBACKS:
             EVENT_CALLBACKS[tab_id] = {}
         if tab_id not in EVENT_LOGS:
-            EVENT_LOGS[tab_id] = []
+            EVENT_LOGS[tab_id] = _new_log()
+        
+        loop_time = asyncio.get_running_loop().time
+        pattern_re = _compile_url_glob(filter_pattern) if filter_pattern else None
         
         def event_callback(event_data):
+            if event_type == 'Page.javascriptDialogOpening':
+                if isinstance(event_data, dict) and 'params' in event_data:
+                    LAST_DIALOG[tab_id] = event_data['params'].get('message', '')
+            elif event_type == 'Page.javascriptDialogClosed':
+                LAST_DIALOG.pop(tab_id, None)
+            if pattern_re is not None:
+                # Events that carry no URL (console messages, dialogs, ...) are always logged
+                url = _event_url(event_data)
+                if url and not pattern_re.match(url):
+                    return
             EVENT_LOGS[tab_id].append({
                 "callback_id": callback_id,
                 "event_type": event_type,
-                "timestamp": asyncio.get_event_loop().time(),
+                "timestamp": loop_time(),
                 "data": event_data,
                 "filter_pattern": filter_pattern
             })
         
         registered_callback_id = await tab.on(event_type, event_callback)
         
-        EVENT_CALLBACKS[tab_id][callback_id] = {
-            "pydoll_callback_id": registered_callback_id,
-            "event_type": event_type,
-            "filter_pattern": filter_pattern
-        }
+        EVENT_CALLBACKS[tab_id][callback_id] = EventCallback(
+            registered_callback_id, event_type, filter_pattern, pattern_re
+        )
         
         return create_success_response(f"Event callback '{callback_id}' registered for '{event_type}'")
     except Exception as e:
-        return create_error_response(f"Register event callback failed: {str(e)}")
+        return create_exception_response("Register event callback failed", e)
 
 async def remove_event_callback(tab_id: str, callback_id: str):
     """Remove a specific event callback."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         if tab_id not in EVENT_CALLBACKS or callback_id not in EVENT_CALLBACKS[tab_id]:
             raise ValueError(f"Callback '{callback_id}' not found")
         
-        callback_info = EVENT_CALLBACKS[tab_id][callback_id]
-        pydoll_callback_id = callback_info["pydoll_callback_id"]
-        
-        await tab.remove_callback(pydoll_callback_id)
+        await tab.remove_callback(EVENT_CALLBACKS[tab_id][callback_id].pydoll_callback_id)
         
-        del EVENT_CALLBACKS[tab_id][callback_id]
+        EVENT_CALLBACKS[tab_id].pop(callback_id, None)
         
         return create_success_response(f"Event callback '{callback_id}' removed successfully")
     except Exception as e:
-        return create_error_response(f"Remove event callback failed: {str(e)}")
+        return create_exception_response("Remove event callback failed", e)
 
 async def clear_event_callbacks(tab_id: str):
     """Clear all event callbacks for a tab."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         await tab.clear_callbacks()
         
         if tab_id in EVENT_CALLBACKS:
             EVENT_CALLBACKS[tab_id] = {}
         if tab_id in EVENT_LOGS:
-            EVENT_LOGS[tab_id] = []
+            EVENT_LOGS[tab_id].clear()
+        LAST_DIALOG.pop(tab_id, None)
         
         return create_success_response("All event callbacks cleared successfully")
     except Exception as e:
-        return create_error_response(f"Clear event callbacks failed: {str(e)}")
+        return create_exception_response("Clear event callbacks failed", e)
 
 async def get_event_logs(tab_id: str, event_type: Optional[str] = None, limit: int = 100):
     """
@@ -4630,19 +5068,22 @@ async def get_event_logs(tab_id: str, event_type: Optional[str] = None, limit: i
     get_event_logs(tab_id, event_type="console", limit=10)
     """
     try:
-        if tab_id not in EVENT_LOGS:
-            EVENT_LOGS[tab_id] = []
-        
-        logs = EVENT_LOGS[tab_id]
+        logs = EVENT_LOGS.get(tab_id, ())
+        tail = limit if limit and limit > 0 else None
         
         if event_type:
-            logs = [log for log in logs if log.get("event_type") == event_type]
-        
-        logs = logs[-limit:] if limit and limit > 0 else logs
+            # Walk back from the newest entry and stop once `tail` matches are collected
+            matches = (log for log in reversed(logs) if log.get("event_type") == event_type)
+            logs = list(islice(matches, tail))
+            logs.reverse()
+        elif tail is not None:
+            logs = list(islice(logs, max(0, len(logs) - tail), None))
+        else:
+            logs = list(logs)
         
-        return create_success_response(json.dumps(logs, indent=2, default=str))
+        return create_json_response(logs)
     except Exception as e:
-        return create_error_response(f"Get event logs failed: {str(e)}")
+        return create_exception_response("Get event logs failed", e)
 
 # === REQUEST INTERCEPTION IMPLEMENTATIONS ===
 
@@ -4707,9 +5148,7 @@ async def continue_request(
     )
     """
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         kwargs = {"request_id": request_id}
         if url:
@@ -4717,8 +5156,7 @@ async def continue_request(
         if method:
             kwargs["method"] = method
         if headers:
-            header_entries = [HeaderEntry(name=h["name"], value=h["value"]) for h in headers]
-            kwargs["headers"] = header_entries
+            kwargs["headers"] = _header_entries(headers)
         if post_data:
             kwargs["post_data"] = post_data
         
@@ -4726,38 +5164,18 @@ async def continue_request(
         
         return create_success_response(f"Request '{request_id}' continued successfully")
     except Exception as e:
-        return create_error_response(f"Continue request failed: {str(e)}")
+        return create_exception_response("Continue request failed", e)
 
 async def fail_request(tab_id: str, request_id: str, error_reason: str = "Failed"):
     """Fail an intercepted request."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
-        
-        # Map common error reasons to PyDoll ErrorReason enum
-        error_map = {
-            "FAILED": ErrorReason.FAILED,
-            "ABORTED": ErrorReason.ABORTED,
-            "TIMEDOUT": ErrorReason.TIMED_OUT,
-            "TIMEOUT": ErrorReason.TIMED_OUT,
-            "ACCESSDENIED": ErrorReason.ACCESS_DENIED,
-            "CONNECTIONCLOSED": ErrorReason.CONNECTION_CLOSED,
-            "CONNECTIONRESET": ErrorReason.CONNECTION_RESET,
-            "CONNECTIONREFUSED": ErrorReason.CONNECTION_REFUSED,
-            "CONNECTIONABORTED": ErrorReason.CONNECTION_ABORTED,
-            "CONNECTIONFAILED": ErrorReason.CONNECTION_FAILED,
-            "NAMENOTRESOLVED": ErrorReason.NAME_NOT_RESOLVED,
-        }
-        
-        error_key = error_reason.upper().replace("_", "")
-        error_enum = error_map.get(error_key, ErrorReason.FAILED)
+        tab = require_tab(tab_id)
         
-        await tab.fail_request(request_id, error_enum)
+        await tab.fail_request(request_id, _resolve_error_reason(error_reason))
         
         return create_success_response(f"Request '{request_id}' failed with reason '{error_reason}'")
     except Exception as e:
-        return create_error_response(f"Fail request failed: {str(e)}")
+        return create_exception_response("Fail request failed", e)
 
 async def fulfill_request(
     tab_id: str,
@@ -4769,9 +5187,7 @@ async def fulfill_request(
 ):
     """Fulfill an intercepted request with custom response."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         kwargs = {
             "request_id": request_id,
@@ -4779,18 +5195,11 @@ async def fulfill_request(
         }
         
         if response_headers:
-            header_entries = [HeaderEntry(name=h["name"], value=h["value"]) for h in response_headers]
-            kwargs["response_headers"] = header_entries
+            kwargs["response_headers"] = _header_entries(response_headers)
         
         if binary_body:
-            # Decode base64 binary data
-            try:
-                decoded_data = base64.b64decode(binary_body)
-                # Try to decode as UTF-8, fallback to base64 string if not possible
-                kwargs["body"] = decoded_data.decode('utf-8')
-            except UnicodeDecodeError:
-                # Keep as base64 string for binary content
-                kwargs["body"] = binary_body
+            # Fetch.fulfillRequest takes the body base64-encoded, so pass it straight through
+            kwargs["body"] = binary_body
         elif body:
             kwargs["body"] = body
         
@@ -4798,18 +5207,18 @@ async def fulfill_request(
         
         return create_success_response(f"Request '{request_id}' fulfilled with status {response_code}")
     except Exception as e:
-        return create_error_response(f"Fulfill request failed: {str(e)}")
+        return create_exception_response("Fulfill request failed", e)
+
+def _decode_base64_text(data: str) -> str:
+    return base64.b64decode(data).decode('utf-8', errors='ignore')
 
 async def get_network_response_body(tab_id: str, request_id: str):
     """Get the response body for a specific network request."""
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         # Use NetworkCommands to get response body
         try:
-            from pydoll.commands import NetworkCommands
             result = await tab._execute_command(NetworkCommands.get_response_body(request_id))
             
             if isinstance(result, dict):
@@ -4817,10 +5226,12 @@ async def get_network_response_body(tab_id: str, request_id: str):
                 is_base64 = result.get('base64Encoded', False)
                 
                 if is_base64:
-                    import base64
                     try:
-                        body = base64.b64decode(body).decode('utf-8', errors='ignore')
-                    except:
+                        if len(body) > THREAD_DECODE_THRESHOLD:
+                            body = await asyncio.to_thread(_decode_base64_text, body)
+                        else:
+                            body = _decode_base64_text(body)
+                    except ValueError:
                         pass  # Keep as base64 if decode fails
                 
                 return create_success_response(body)
@@ -4836,7 +5247,55 @@ async def get_network_response_body(tab_id: str, request_id: str):
             
             raise cmd_error
     except Exception as e:
-        return create_error_response(f"Get network response body failed: {str(e)}")
+        return create_exception_response("Get network response body failed", e)
+
+NETWORK_LOG_FIELDS = ("url", "method", "status", "timestamp", "request_id")
+
+def _network_event_fields(log_entry: Dict) -> tuple:
+    """NETWORK_LOG_FIELDS from a raw CDP network event"""
+    params = log_entry.get('params', {})
+    request = params.get('request', {})
+    response = params.get('response', {})
+    return (
+        request.get('url') or response.get('url'),
+        request.get('method'),
+        response.get('status'),
+        params.get('timestamp'),
+        params.get('requestId')
+    )
+
+def _network_flat_fields(log_entry: Dict) -> tuple:
+    """NETWORK_LOG_FIELDS from an already-flattened log dict"""
+    return (
+        log_entry.get('url'),
+        log_entry.get('method'),
+        log_entry.get('status'),
+        log_entry.get('timestamp'),
+        log_entry.get('requestId') or log_entry.get('request_id')
+    )
+
+def _network_object_fields(log_entry: Any) -> tuple:
+    """NETWORK_LOG_FIELDS from a log object with attributes"""
+    return (
+        getattr(log_entry, 'url', None),
+        getattr(log_entry, 'method', None),
+        getattr(log_entry, 'status', None),
+        getattr(log_entry, 'timestamp', None),
+        getattr(log_entry, 'requestId', None) or getattr(log_entry, 'request_id', None)
+    )
+
+# Object-format logs name the request id either way; one C-level getter per convention
+_NETWORK_OBJECT_GETTERS = {
+    id_name: operator.attrgetter("url", "method", "status", "timestamp", id_name)
+    for id_name in ("requestId", "request_id")
+}
+
+def _network_object_extractor(sample: Any) -> Callable[[Any], tuple]:
+    """Pick an attrgetter matching the attributes of a sample log object, else the getattr fallback"""
+    id_name = "requestId" if getattr(sample, "requestId", None) else "request_id"
+    if all(hasattr(sample, name) for name in ("url", "method", "status", "timestamp", id_name)):
+        return _NETWORK_OBJECT_GETTERS[id_name]
+    return _network_object_fields
 
 async def get_network_logs(tab_id: str, filter_pattern: Optional[str] = None, limit: int = 100):
     """
@@ -4890,59 +5349,43 @@ async def get_network_logs(tab_id: str, filter_pattern: Optional[str] = None, li
     Prerequisites: Call enable_network_events() first to start capturing logs.
     """
     try:
-        tab = get_tab_session(tab_id)
-        if not tab:
-            raise ValueError(f"Tab '{tab_id}' not found")
+        tab = require_tab(tab_id)
         
         # Check if network events are enabled
         if not hasattr(tab, '_network_events_enabled') or not tab._network_events_enabled:
             return create_error_response("Network events must be enabled first. Please call 'enable_network_events' on this tab before attempting to get network logs.")
             
-        logs = await tab.get_network_logs(filter=filter_pattern)
+        # PyDoll's own filter is a plain substring test, so apply the glob here
+        logs = await tab.get_network_logs()
         
         # Ensure limit is an integer
         limit = int(limit) if limit is not None else 100
-        if limit > 0:
+        if filter_pattern:
+            # Newest first, stopping once `limit` matches are found
+            pattern_re = _compile_url_glob(filter_pattern)
+            matches = (log for log in reversed(logs) if pattern_re.match(_event_url(log)))
+            logs = list(islice(matches, limit if limit > 0 else None))
+            logs.reverse()
+        elif limit > 0:
             logs = logs[-limit:]
         
         log_data = []
-        for log_entry in logs:
-            # Handle different log entry formats (raw events vs structured objects)
-            if isinstance(log_entry, dict):
-                # Extract from network event format
-                if 'params' in log_entry:
-                    params = log_entry['params']
-                    request = params.get('request', {})
-                    response = params.get('response', {})
-                    log_data.append({
-                        "url": request.get('url') or response.get('url'),
-                        "method": request.get('method'),
-                        "status": response.get('status'),
-                        "timestamp": params.get('timestamp'),
-                        "request_id": params.get('requestId')
-                    })
-                else:
-                    # Direct format
-                    log_data.append({
-                        "url": log_entry.get('url'),
-                        "method": log_entry.get('method'),
-                        "status": log_entry.get('status'),
-                        "timestamp": log_entry.get('timestamp'),
-                        "request_id": log_entry.get('requestId') or log_entry.get('request_id')
-                    })
+        if logs:
+            # Entries from one source share a format, so pick the extractor once per batch
+            first = logs[0]
+            if isinstance(first, dict):
+                extract = _network_event_fields if 'params' in first else _network_flat_fields
             else:
-                # Object with attributes
-                log_data.append({
-                    "url": getattr(log_entry, 'url', None),
-                    "method": getattr(log_entry, 'method', None),
-                    "status": getattr(log_entry, 'status', None),
-                    "timestamp": getattr(log_entry, 'timestamp', None),
-                    "request_id": getattr(log_entry, 'requestId', None) or getattr(log_entry, 'request_id', None)
-                })
+                extract = _network_object_extractor(first)
+            try:
+                log_data = [dict(zip(NETWORK_LOG_FIELDS, extract(log_entry), strict=True)) for log_entry in logs]
+            except AttributeError:
+                # A later object lacks one of the sample's attributes; fall back to getattr
+                log_data = [dict(zip(NETWORK_LOG_FIELDS, _network_object_fields(log_entry), strict=True)) for log_entry in logs]
         
-        return create_success_response(json.dumps(log_data, indent=2, default=str))
+        return create_json_response(log_data)
     except Exception as e:
-        return create_error_response(f"Get network logs failed: {str(e)}")
+        return create_exception_response("Get network logs failed", e)
 
 # === IFRAME SUPPORT ===
 
@@ -5019,42 +5462,36 @@ async def get_frame(element_id: str, frame_tab_id: str, validate_iframe: bool =
         if not element:
             raise ValueError(f"Element '{element_id}' not found")
         
-        # Find the tab that contains this element
-        parent_tab = None
-        for tab_session in TAB_SESSIONS.values():
-            if hasattr(tab_session, '_connection_handler') and tab_session._connection_handler == element._connection_handler:
-                parent_tab = tab_session
-                break
+        # Find the tab that contains this element: the ownership index first, then by connection
+        parent_tab = TAB_SESSIONS.get(ELEMENT_TO_TAB.get(element_id))
+        if parent_tab is None:
+            parent_tab = next(
+                (tab_session for tab_session in TAB_SESSIONS.values()
+                 if getattr(tab_session, '_connection_handler', None) == element._connection_handler),
+                None
+            )
         
         if not parent_tab:
             raise ValueError("Could not find parent tab for the element")
         
-        # Enhanced validation if requested
+        # Enhanced validation if requested; unexpected errors fall through to the outer handler
         if validate_iframe:
+            tag_name = element.tag_name
+            if tag_name.lower() != 'iframe':
+                return create_error_response(f"Element is a '{tag_name}', not an iframe. Only iframe elements can be used with get_frame().")
+            
+            src = element.get_attribute('src')
+            srcdoc = None if src else element.get_attribute('srcdoc')
+            if not src and not srcdoc:
+                return create_error_response("Iframe lacks both 'src' and 'srcdoc' attributes. Cannot access iframe content without a source.")
+            if not src:
+                return create_error_response("Iframe uses 'srcdoc' attribute (inline content). Frame targeting is only supported for iframes with 'src' attributes pointing to separate documents.")
+            
+            # Cross-origin or still-loading iframes fail here specifically
             try:
-                # Check if element is actually an iframe
-                tag_name = await element.tag_name
-                if tag_name.lower() != 'iframe':
-                    return create_error_response(f"Element is a '{tag_name}', not an iframe. Only iframe elements can be used with get_frame().")
-                
-                # Check for src attribute
-                src = await element.get_attribute('src')
-                if not src:
-                    # Check for srcdoc (inline content)
-                    srcdoc = await element.get_attribute('srcdoc')
-                    if not srcdoc:
-                        return create_error_response("Iframe lacks both 'src' and 'srcdoc' attributes. Cannot access iframe content without a source.")
-                    else:
-                        return create_error_response("Iframe uses 'srcdoc' attribute (inline content). Frame targeting is only supported for iframes with 'src' attributes pointing to separate documents.")
-                
-                # Check if iframe is loaded
-                try:
-                    await element.execute_script("return this.contentDocument != null;")
-                except:
-                    return create_error_response("Cannot access iframe content. This may be due to cross-origin restrictions or the iframe not being fully loaded.")
-                
-            except Exception as validation_error:
-                return create_error_response(f"Iframe validation failed: {str(validation_error)}")
+                await element.execute_script("function(){ return this.contentDocument != null; }")
+            except Exception:
+                return create_error_response("Cannot access iframe content. This may be due to cross-origin restrictions or the iframe not being fully loaded.")
         
         # Use the pydoll get_frame method
         try:
@@ -5075,10 +5512,18 @@ async def get_frame(element_id: str, frame_tab_id: str, validate_iframe: bool =
         
         return create_success_response(f"Frame context created as tab '{frame_tab_id}'")
     except Exception as e:
-        return create_error_response(f"Get frame failed: {str(e)}")
+        return create_exception_response("Get frame failed", e)
 
 # === BROWSER PREFERENCES ===
 
+@functools.lru_cache(maxsize=16)
+def _download_behavior_command(download_path: str):
+    """Browser.setDownloadBehavior command allowing downloads into download_path"""
+    return BrowserCommands.set_download_behavior(
+        behavior=DownloadBehavior.ALLOW,
+        download_path=download_path
+    )
+
 async def set_browser_preferences(
     session_id: str,
     preferences: Optional[Dict] = None,
@@ -5092,29 +5537,25 @@ async def set_browser_preferences(
         if not browser:
             raise ValueError(f"Browser session '{session_id}' not found")
         
-        # Try to get active tab's connection handler
-        active_tab = None
-        for tab_session in TAB_SESSIONS.values():
-            if hasattr(tab_session, '_connection_handler'):
-                active_tab = tab_session
-                break
-        
-        if not active_tab:
-            return create_error_response("No active tab found to execute preferences setting")
-        
-        # Use Browser commands to set runtime preferences where possible
-        from pydoll.commands import BrowserCommands
-        from pydoll.protocol.browser.methods import DownloadBehavior
+        if not (preferences or download_directory or accept_languages or prompt_for_download is not None):
+            return create_success_response("No preferences specified to change")
         
         changes = []
         
-        # Set download directory and behavior
+        # Set download directory and behavior using Browser commands; it's the only
+        # preference applied live, so only it needs a tab to send through
         if download_directory:
+            # Send through one of this session's tabs, preferring the active one
+            session_tabs = SESSION_TABS.get(session_id, set())
+            tab_id = ACTIVE_TAB_ID if ACTIVE_TAB_ID in session_tabs else next(iter(session_tabs), None)
+            active_tab = TAB_SESSIONS.get(tab_id)
+            
+            if not active_tab:
+                return create_error_response("No active tab found to execute preferences setting")
+            
             try:
-                command = BrowserCommands.set_download_behavior(
-                    behavior=DownloadBehavior.ALLOW,
-                    download_path=download_directory
-                )
+                # Shallow copy: PyDoll stamps a command id onto the dict it sends
+                command = dict(_download_behavior_command(download_directory))
                 await active_tab._connection_handler.execute_command(command)
                 changes.append(f"download_directory: {download_directory}")
             except Exception as e:
@@ -5130,12 +5571,9 @@ async def set_browser_preferences(
         if preferences:
             changes.append(f"custom preferences: {len(preferences)} items (requires browser restart)")
         
-        if not changes:
-            return create_success_response("No preferences specified to change")
-        
         return create_success_response(f"Browser preferences updated: {', '.join(changes)}. Note: Some preferences may require browser restart to take full effect.")
     except Exception as e:
-        return create_error_response(f"Set browser preferences failed: {str(e)}")
+        return create_exception_response("Set browser preferences failed", e)
 
 # === SESSION MANAGEMENT ===
 
@@ -5151,54 +5589,57 @@ async def list_sessions():
             "network_logs": {tab_id: len(logs) for tab_id, logs in NETWORK_LOGS.items()}
         }
         
-        return create_success_response(json.dumps(session_info, indent=2))
+        return create_json_response(session_info)
     except Exception as e:
-        return create_error_response(f"List sessions failed: {str(e)}")
+        return create_exception_response("List sessions failed", e)
 
 async def get_session_info(session_id: str):
     """Get detailed information about a specific session."""
     try:
         info = {}
         
+        tab = None
         if session_id in BROWSER_SESSIONS:
-            browser = BROWSER_SESSIONS[session_id]
             info["type"] = "browser"
-            info["session_id"] = session_id
-            info["status"] = "active"
-        elif session_id in TAB_SESSIONS:
-            tab = TAB_SESSIONS[session_id]
+        else:
+            tab = TAB_SESSIONS.get(session_id)
+            if tab is None:
+                raise ValueError(f"Session '{session_id}' not found")
             info["type"] = "tab"
-            info["session_id"] = session_id
-            info["status"] = "active"
+        info["session_id"] = session_id
+        info["status"] = "active"
+        
+        if tab is not None:
+            # Same cached reads as get_page_url / get_page_title
             try:
-                info["url"] = await tab.current_url()
-                result = await tab.execute_script("document.title")
-                info["title"] = result.result.value if hasattr(result, 'result') and hasattr(result.result, 'value') else ""
-            except:
+                info["url"] = await _page_state(session_id, tab, "url", lambda: tab.current_url)
+                result = await _page_state(session_id, tab, "title", lambda: tab.execute_script("return document.title;"))
+                info["title"] = _unwrap_cdp_value(result) or ""
+            except Exception:
                 pass
-        else:
-            raise ValueError(f"Session '{session_id}' not found")
         
-        return create_success_response(json.dumps(info, indent=2))
+        return create_json_response(info)
     except Exception as e:
-        return create_error_response(f"Get session info failed: {str(e)}")
+        return create_exception_response("Get session info failed", e)
 
 async def cleanup_elements(tab_id: Optional[str] = None):
     """Clean up cached element references."""
     try:
         if tab_id:
-            elements_to_remove = [elem_id for elem_id in ELEMENT_CACHE.keys() if elem_id.startswith(f"{tab_id}_")]
-            for elem_id in elements_to_remove:
-                del ELEMENT_CACHE[elem_id]
+            count = _forget_tab_elements(tab_id)
             
-            return create_success_response(f"Cleaned up {len(elements_to_remove)} elements for tab '{tab_id}'")
+            return create_success_response(f"Cleaned up {count} elements for tab '{tab_id}'")
         else:
             count = len(ELEMENT_CACHE)
             ELEMENT_CACHE.clear()
+            TAB_ELEMENTS.clear()
+            ELEMENT_TO_TAB.clear()
+            ELEMENT_STATE_CACHE.clear()
+            ELEMENT_HTML_CACHE.clear()
             
             return create_success_response(f"Cleaned up {count} cached elements")
     except Exception as e:
-        return create_error_response(f"Cleanup elements failed: {str(e)}")
+        return create_exception_response("Cleanup elements failed", e)
 
 # Create a tool dispatcher mapping for easier maintenance
 TOOL_HANDLERS = {
@@ -5231,6 +5672,7 @@ TOOL_HANDLERS = {
     "get_element_bounds": get_element_bounds,
     "get_element_bounds_js": get_element_bounds_js,
     "is_element_visible": is_element_visible,
+    "get_element_state": get_element_state,
     "is_element_enabled": is_element_enabled,
     "is_element_selected": is_element_selected,
     "is_element_on_top": is_element_on_top,
@@ -5253,6 +5695,7 @@ TOOL_HANDLERS = {
     "delete_cookies": delete_cookies,
     "upload_file": upload_file,
     "download_file": download_file,
+    "download_files": download_files,
     "expect_file_chooser": expect_file_chooser,
     "enable_file_chooser_intercept": enable_file_chooser_intercept,
     "disable_file_chooser_intercept": disable_file_chooser_intercept,
@@ -5286,78 +5729,192 @@ TOOL_HANDLERS = {
 # JSON-RPC server implementation only
 
 
+# Upper bound on bytes taken from stdin per read by the request reader thread
+STDIN_READ_SIZE = 64 * 1024
+
+# Tool arguments naming the tab or browser session a call acts on; calls sharing one run
+# in arrival order. get_session_info takes tab ids as session_id, so they share one namespace.
+ORDER_KEY_ARGS = ("tab_id", "frame_tab_id", "session_id", "browser_session_id")
+
+# Tools that reach beyond the tab or session they name (closing a session closes its
+# tabs), so they wait for everything in flight like a call that names nothing
+BARRIER_TOOLS = {"close_browser_session", "cleanup_elements"}
+
+def _request_order_keys(request: Any) -> Optional[Set[str]]:
+    """Tabs and sessions a tool call acts on, or None when it must wait for all earlier requests
+
+    Calls that name no tab or session (press_key on the active tab, list_sessions, ...),
+    BARRIER_TOOLS, and calls naming an element whose owner isn't known yet are barriers.
+    Other JSON-RPC methods don't touch browser state and need no ordering.
+    """
+    if not isinstance(request, dict) or request.get("method") != "tools/call":
+        return set()
+    params = request.get("params")
+    if not isinstance(params, dict) or params.get("name") in BARRIER_TOOLS:
+        return None
+    arguments = params.get("arguments")
+    if not isinstance(arguments, dict):
+        return None
+    
+    keys = {arguments[name] for name in ORDER_KEY_ARGS if isinstance(arguments.get(name), str)}
+    element_id = arguments.get("element_id")
+    if element_id is not None:
+        owner = ELEMENT_TO_TAB.get(element_id)
+        if owner is None:
+            # The element may come from a request that hasn't finished yet
+            return None
+        keys.add(owner)
+    return keys or None
+
+async def handle_request_line(line: bytes, request: Any = None) -> Dict[str, Any]:
+    """Parse and dispatch one JSON-RPC request line, returning its response
+
+    Pass request when the caller has already decoded the line.
+    """
+    try:
+        if request is None:
+            request = json_loads(line)
+        method = request.get("method")
+        request_id = request.get("id")
+        params = request.get("params", {})
+        
+        if method == "initialize":
+            return handle_initialize(request_id)
+        elif method == "tools/list":
+            return handle_tools_list(request_id)
+        elif method == "tools/call":
+            tool_name = params.get("name")
+            arguments = params.get("arguments", {})
+            return await handle_tool_call_async(request_id, tool_name, arguments)
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {
+                    "code": -32601,
+                    "message": f"Method not found: {method}"
+                }
+            }
+        
+    except json.JSONDecodeError as e:
+        return {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {
+                "code": -32700,
+                "message": f"Parse error: {str(e)}"
+            }
+        }
+        
+    except Exception as e:
+        return {
+            "jsonrpc": "2.0", 
+            "id": request.get("id") if isinstance(request, dict) else None,
+            "error": {
+                "code": -32603,
+                "message": f"Internal error: {str(e)}"
+            }
+        }
+
 async def main_async():
     """Async JSON-RPC server main function"""
     
-    print(f"PyDoll MCP Server v{__version__} - Complete JSON-RPC Implementation", file=sys.stderr, flush=True)
-    print(f"Using Chrome at: {DEFAULT_CHROME_PATH}", file=sys.stderr, flush=True)
-    print("Server ready for JSON-RPC requests...", file=sys.stderr, flush=True)
+    sys.stderr.write(STARTUP_BANNER)
+    sys.stderr.flush()
     
     try:
-        # Windows-compatible stdin reading
-        loop = asyncio.get_event_loop()
-        
-        while True:
+        loop = asyncio.get_running_loop()
+        lines: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+        
+        def enqueue(batch: List[Optional[bytes]]):
+            for line in batch:
+                lines.put_nowait(line)
+        
+        def read_stdin():
+            """Forward stdin lines to the event loop; None marks end of input"""
+            # A plain blocking thread keeps stdin reading Windows-compatible. Reading whatever
+            # is available and splitting it here hands every complete line from one read to
+            # the loop in a single wakeup.
+            pending = bytearray()
             try:
-                # Use run_in_executor for blocking stdin read (Windows-compatible)
-                line = await loop.run_in_executor(None, sys.stdin.readline)
-                if not line:
-                    break
-                    
-                line = line.strip()
-                if not line:
-                    continue
+                while True:
+                    chunk = sys.stdin.buffer.read1(STDIN_READ_SIZE)
+                    if not chunk:
+                        break
+                    pending += chunk
+                    end = pending.rfind(b"\n")
+                    if end == -1:
+                        continue
+                    complete = bytes(pending[:end])
+                    del pending[:end + 1]
+                    loop.call_soon_threadsafe(enqueue, complete.split(b"\n"))
             except Exception as e:
-                logger.error(f"Error reading from stdin: {e}")
-                break
-                
+                logger.error("Error reading from stdin: %s", e)
+            loop.call_soon_threadsafe(enqueue, [bytes(pending), None] if pending else [None])
+        
+        threading.Thread(target=read_stdin, name="stdin-reader", daemon=True).start()
+        
+        # Each request runs as its own task and answers as soon as it finishes, so a slow
+        # call doesn't hold back the rest. Requests on the same tab or session still run
+        # in the order they arrived; a barrier (see _request_order_keys) waits for
+        # everything before it and holds back everything after it.
+        in_flight: Set[asyncio.Future] = set()
+        sequences = count(1)
+        last_for_key: Dict[str, asyncio.Future] = {}
+        barrier: Optional[asyncio.Future] = None
+        tasks: Set[asyncio.Task] = set()
+        
+        async def serve(line: bytes, request: Any, sequence: int, after: List[asyncio.Future], done: asyncio.Future):
+            # Each task runs in its own context copy, so this only tags this request
+            REQUEST_SEQUENCE.set(sequence)
             try:
-                request = json.loads(line)
-                method = request.get("method")
-                request_id = request.get("id")
-                params = request.get("params", {})
-                
-                if method == "initialize":
-                    response = handle_initialize(request_id)
-                elif method == "tools/list":
-                    response = handle_tools_list(request_id)
-                elif method == "tools/call":
-                    tool_name = params.get("name")
-                    arguments = params.get("arguments", {})
-                    response = await handle_tool_call_async(request_id, tool_name, arguments)
-                else:
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "error": {
-                            "code": -32601,
-                            "message": f"Method not found: {method}"
-                        }
-                    }
-                
-                send_response(response)
-                
-            except json.JSONDecodeError as e:
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32700,
-                        "message": f"Parse error: {str(e)}"
-                    }
-                }
-                send_response(error_response)
-                
-            except Exception as e:
-                error_response = {
-                    "jsonrpc": "2.0", 
-                    "id": request.get("id") if 'request' in locals() else None,
-                    "error": {
-                        "code": -32603,
-                        "message": f"Internal error: {str(e)}"
-                    }
-                }
-                send_response(error_response)
+                if after:
+                    await asyncio.wait(after)
+                send_response(await handle_request_line(line, request))
+            finally:
+                done.set_result(None)
+                in_flight.discard(done)
+        
+        def dispatch(line: bytes):
+            nonlocal barrier
+            try:
+                request = json_loads(line)
+            except json.JSONDecodeError:
+                # handle_request_line reports the parse error
+                request = None
+            keys = _request_order_keys(request)
+            
+            if keys is None:
+                after = list(in_flight)
+            else:
+                after = [last_for_key[key] for key in keys if key in last_for_key]
+                if barrier is not None:
+                    after.append(barrier)
+            after = [future for future in after if not future.done()]
+            
+            done = loop.create_future()
+            in_flight.add(done)
+            if keys is None:
+                barrier = done
+            else:
+                for key in keys:
+                    last_for_key[key] = done
+            
+            task = loop.create_task(serve(line, request, next(sequences), after, done))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        
+        while True:
+            raw = await lines.get()
+            if raw is None:
+                break
+            line = raw.strip()
+            if line:
+                dispatch(line)
+        
+        # Let requests already read finish answering before shutting down
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
     
     except KeyboardInterrupt:
         print("Server shutdown requested", file=sys.stderr, flush=True)
@@ -5365,8 +5922,8 @@ async def main_async():
         print(f"Server error: {e}", file=sys.stderr, flush=True)
         sys.exit(1)
     finally:
-        # Cleanup all sessions
-        for browser in BROWSER_SESSIONS.values():
+        # Cleanup all sessions; browsers shut down independently, so stop them together
+        async def shutdown_browser(browser):
             try:
                 if hasattr(browser, 'quit'):
                     browser.quit()
@@ -5376,16 +5933,30 @@ async def main_async():
                     await browser.close()
             except:
                 pass
+        
+        await asyncio.gather(
+            *(shutdown_browser(browser) for browser in BROWSER_SESSIONS.values()),
+            return_exceptions=True,
+        )
         BROWSER_SESSIONS.clear()
         TAB_SESSIONS.clear()
         ELEMENT_CACHE.clear()
+        SESSION_TABS.clear()
+        TAB_ELEMENTS.clear()
+        ELEMENT_TO_TAB.clear()
 
 def run_server():
     """Main entry point - JSON-RPC server only"""
+    cloudflare_log_listener.start()
     try:
-        asyncio.run(main_async())
+        if uvloop is not None:
+            uvloop.run(main_async())
+        else:
+            asyncio.run(main_async())
     except KeyboardInterrupt:
         print("Server shutdown", file=sys.stderr, flush=True)
+    finally:
+        cloudflare_log_listener.stop()
 
 if __name__ == "__main__":
     # Perform auto-update check on startup (unless disabled)
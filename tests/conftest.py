@@ -2,6 +2,7 @@
 Pytest configuration and shared fixtures for PyDoll MCP testing.
 """
 import asyncio
+import itertools
 import json
 import os
 import sys
@@ -94,9 +95,12 @@ class MCPTestClient:
     def __init__(self, server_path: str):
         self.server_path = server_path
         self.process = None
+        # Tests in a module share one server; keep their request/response pairs from interleaving
+        self._lock = asyncio.Lock()
+        self._wire_ids = itertools.count(1)
 
     async def start(self):
-        """Start the MCP server process."""
+        """Start the MCP server process and wait until it answers requests."""
         try:
             self.process = await asyncio.create_subprocess_exec(
                 sys.executable, self.server_path,
@@ -105,26 +109,31 @@ class MCPTestClient:
                 stderr=asyncio.subprocess.PIPE,
                 env={**os.environ, "PYTHONUNBUFFERED": "1"}
             )
-            # Give server time to start up
-            await asyncio.sleep(0.5)
+            # The probe waits in the pipe until the server starts reading, so its
+            # response marks readiness without guessing a startup delay
+            await self.send_request({
+                "jsonrpc": "2.0",
+                "id": 0,
+                "method": "tools/list"
+            })
         except Exception as e:
             print(f"Warning: Failed to start MCP server: {e}")
             raise
 
-    async def send_request(self, request: dict) -> dict:
-        """Send JSON-RPC request to server."""
-        if not self.process:
-            raise RuntimeError("Server not started")
-
-        try:
-            request_json = json.dumps(request) + "\n"
-            self.process.stdin.write(request_json.encode())
-            await self.process.stdin.drain()
-
-            # Wait for response with timeout
+    async def _read_responses(self, wire_ids: set[str]) -> dict:
+        """Read stdout until every wire id has answered, dropping any other response.
+
+        A request that timed out in an earlier test can still answer later; since
+        the server is shared, its late line must not be taken for a newer request's.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 10.0
+        pending = set(wire_ids)
+        responses = {}
+        while pending:
             response_line = await asyncio.wait_for(
                 self.process.stdout.readline(),
-                timeout=10.0
+                timeout=max(0.0, deadline - loop.time())
             )
 
             if not response_line:
@@ -134,12 +143,54 @@ class MCPTestClient:
             if not response_text:
                 raise RuntimeError("Empty response from server")
 
-            return json.loads(response_text)
+            response = json.loads(response_text)
+            wire_id = response.get("id")
+            if wire_id in pending:
+                pending.discard(wire_id)
+                responses[wire_id] = response
+
+        return responses
+
+    def _wire_id(self) -> str:
+        """Unique id for the wire, so responses match up whatever id the test used."""
+        return f"test-client-{next(self._wire_ids)}"
+
+    async def send_request(self, request: dict) -> dict:
+        """Send JSON-RPC request to server."""
+        responses = await self.send_batch([request])
+        return responses[request.get("id")]
+
+    async def send_batch(self, requests: list[dict]) -> dict:
+        """Send several JSON-RPC requests in one write and return their responses keyed by id.
+
+        The server runs requests on different tabs and sessions concurrently, so
+        only batch requests that don't depend on each other's effects.
+        """
+        if not self.process:
+            raise RuntimeError("Server not started")
 
-        except json.JSONDecodeError as e:
-            raise RuntimeError(f"Invalid JSON response: {e}") from e
-        except asyncio.TimeoutError as e:
-            raise RuntimeError("Server response timeout") from e
+        async with self._lock:
+            try:
+                request_ids = {self._wire_id(): request.get("id") for request in requests}
+                frames = "".join(
+                    json.dumps({**request, "id": wire_id}) + "\n"
+                    for wire_id, request in zip(request_ids, requests, strict=True)
+                )
+                self.process.stdin.write(frames.encode())
+                await self.process.stdin.drain()
+
+                # Wait for responses with timeout; report them under the ids the test used
+                responses = {}
+                for wire_id, response in (await self._read_responses(set(request_ids))).items():
+                    response["id"] = request_ids[wire_id]
+                    responses[response["id"]] = response
+
+                return responses
+
+            except json.JSONDecodeError as e:
+                raise RuntimeError(f"Invalid JSON response: {e}") from e
+            except asyncio.TimeoutError as e:
+                raise RuntimeError("Server response timeout") from e
 
     async def stop(self):
         """Stop the MCP server process."""
@@ -148,7 +199,7 @@ class MCPTestClient:
             await self.process.wait()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def mcp_client() -> AsyncGenerator[MCPTestClient, None]:
     """Create and manage MCP test client."""
     server_path = Path(__file__).parent.parent / "pydoll-mcp"
@@ -161,18 +212,6 @@ async def mcp_client() -> AsyncGenerator[MCPTestClient, None]:
 
     try:
         await client.start()
-
-        # Test basic connectivity with a simple request
-        try:
-            test_request = {
-                "jsonrpc": "2.0",
-                "id": 0,
-                "method": "tools/list"
-            }
-            await client.send_request(test_request)
-        except Exception as e:
-            pytest.skip(f"MCP server not responding: {e}")
-
         yield client
     except Exception as e:
         pytest.skip(f"Failed to start MCP server: {e}")
@@ -183,6 +222,27 @@ async def mcp_client() -> AsyncGenerator[MCPTestClient, None]:
             pass  # Ignore cleanup errors
 
 
+@pytest.fixture(scope="session")
+def server_module():
+    """Import the server in-process so handlers can be driven with fake tabs; skipped without PyDoll."""
+    pytest.importorskip("pydoll")
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    import pydoll_mcp
+    return pydoll_mcp
+
+
+@pytest.fixture
+def fake_tab(server_module):
+    """Register a mock tab as 'test-tab' and remove it, and any elements cached on it, afterwards."""
+    tab = Mock()
+    tab.execute_script = AsyncMock()
+    tab._execute_command = AsyncMock()
+    server_module.TAB_SESSIONS["test-tab"] = tab
+    yield tab
+    server_module.TAB_SESSIONS.pop("test-tab", None)
+    server_module._forget_tab_elements("test-tab")
+
+
 @pytest.fixture
 def browser_session_data():
     """Test data for browser session creation."""
@@ -220,9 +280,9 @@ def element_selectors():
     }
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def cleanup_temp_files():
-    """Clean up temporary files after each test."""
+    """Clean up temporary files registered by a test; prefer tmp_path for new tests."""
     temp_files = []
     yield temp_files
 
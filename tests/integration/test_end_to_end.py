@@ -11,8 +11,8 @@ import pytest
 class TestEndToEndWorkflows:
     """Test complete browser automation workflows."""
 
-    @pytest.mark.asyncio
-    async def test_complete_browser_session_workflow(self, mcp_client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_complete_browser_session_workflow(self, mcp_client, tmp_path):
         """Test complete browser session lifecycle with real operations."""
         session_id = "e2e-test-session"
         tab_id = f"{session_id}-tab-1"
@@ -63,47 +63,47 @@ class TestEndToEndWorkflows:
                 }
             })
 
-            # 4. Get page information
-            await mcp_client.send_request({
-                "jsonrpc": "2.0",
-                "id": 4,
-                "method": "tools/call",
-                "params": {
-                    "name": "mcp__pydoll-browser__get_page_url",
-                    "arguments": {"tab_id": tab_id}
-                }
-            })
-
-            # 5. Find elements
-            await mcp_client.send_request({
-                "jsonrpc": "2.0",
-                "id": 5,
-                "method": "tools/call",
-                "params": {
-                    "name": "mcp__pydoll-browser__find_elements",
-                    "arguments": {
-                        "tab_id": tab_id,
-                        "base_element_id": "root",
-                        "selector_type": "tag",
-                        "selector_value": "h1"
+            # 4-6. Read page information, find elements and take a screenshot;
+            # these only read the loaded page, so they go out as one batch
+            screenshot_path = str(tmp_path / "e2e-test-screenshot.png")
+            responses = await mcp_client.send_batch([
+                {
+                    "jsonrpc": "2.0",
+                    "id": 4,
+                    "method": "tools/call",
+                    "params": {
+                        "name": "mcp__pydoll-browser__get_page_url",
+                        "arguments": {"tab_id": tab_id}
                     }
-                }
-            })
-
-            # 6. Take screenshot
-            screenshot_path = "/tmp/e2e-test-screenshot.png"
-            screenshot_response = await mcp_client.send_request({
-                "jsonrpc": "2.0",
-                "id": 6,
-                "method": "tools/call",
-                "params": {
-                    "name": "mcp__pydoll-browser__take_screenshot",
-                    "arguments": {
-                        "tab_id": tab_id,
-                        "save_path": screenshot_path
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 5,
+                    "method": "tools/call",
+                    "params": {
+                        "name": "mcp__pydoll-browser__find_elements",
+                        "arguments": {
+                            "tab_id": tab_id,
+                            "base_element_id": "root",
+                            "selector_type": "tag",
+                            "selector_value": "h1"
+                        }
+                    }
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 6,
+                    "method": "tools/call",
+                    "params": {
+                        "name": "mcp__pydoll-browser__take_screenshot",
+                        "arguments": {
+                            "tab_id": tab_id,
+                            "save_path": screenshot_path
+                        }
                     }
                 }
-            })
+            ])
+            screenshot_response = responses[6]
 
             # Verify screenshot was created
             if "result" in screenshot_response:
@@ -121,7 +121,7 @@ class TestEndToEndWorkflows:
                 }
             })
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_form_interaction_workflow(self, mcp_client):
         """Test form interaction and input handling."""
         session_id = "form-test-session"
@@ -178,7 +178,7 @@ class TestEndToEndWorkflows:
         finally:
             await self._cleanup_session(mcp_client, session_id)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_navigation_and_history_workflow(self, mcp_client):
         """Test navigation and browser history operations."""
         session_id = "nav-test-session"
@@ -256,7 +256,7 @@ class TestEndToEndWorkflows:
         finally:
             await self._cleanup_session(mcp_client, session_id)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_javascript_execution_workflow(self, mcp_client):
         """Test JavaScript execution capabilities."""
         session_id = "js-test-session"
@@ -279,34 +279,36 @@ class TestEndToEndWorkflows:
                 }
             })
 
-            # Execute JavaScript
-            js_response = await mcp_client.send_request({
-                "jsonrpc": "2.0",
-                "id": 31,
-                "method": "tools/call",
-                "params": {
-                    "name": "mcp__pydoll-browser__execute_script",
-                    "arguments": {
-                        "tab_id": tab_id,
-                        "script": "document.title"
+            # Execute JavaScript and wait for a condition; neither changes the page
+            responses = await mcp_client.send_batch([
+                {
+                    "jsonrpc": "2.0",
+                    "id": 31,
+                    "method": "tools/call",
+                    "params": {
+                        "name": "mcp__pydoll-browser__execute_script",
+                        "arguments": {
+                            "tab_id": tab_id,
+                            "script": "document.title"
+                        }
                     }
-                }
-            })
-
-            # Wait for function
-            wait_response = await mcp_client.send_request({
-                "jsonrpc": "2.0",
-                "id": 32,
-                "method": "tools/call",
-                "params": {
-                    "name": "mcp__pydoll-browser__wait_for_function",
-                    "arguments": {
-                        "tab_id": tab_id,
-                        "script": "document.readyState === 'complete'",
-                        "timeout": 5
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 32,
+                    "method": "tools/call",
+                    "params": {
+                        "name": "mcp__pydoll-browser__wait_for_function",
+                        "arguments": {
+                            "tab_id": tab_id,
+                            "script": "document.readyState === 'complete'",
+                            "timeout": 5
+                        }
                     }
                 }
-            })
+            ])
+            js_response = responses[31]
+            wait_response = responses[32]
 
             assert "result" in js_response or "error" in js_response
             assert "result" in wait_response or "error" in wait_response
@@ -369,7 +371,7 @@ class TestEndToEndWorkflows:
         })
 
     @pytest.mark.slow
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_stress_session_management(self, mcp_client):
         """Stress test session creation and cleanup."""
         sessions = []
@@ -396,14 +398,17 @@ class TestEndToEndWorkflows:
                 assert "result" in response or "error" in response
 
         finally:
-            # Cleanup all sessions
-            for session_id in sessions:
-                await mcp_client.send_request({
-                    "jsonrpc": "2.0",
-                    "id": 999,
-                    "method": "tools/call",
-                    "params": {
-                        "name": "mcp__pydoll-browser__close_browser_session",
-                        "arguments": {"session_id": session_id}
+            # Cleanup all sessions; they are independent, so close them in one batch
+            if sessions:
+                await mcp_client.send_batch([
+                    {
+                        "jsonrpc": "2.0",
+                        "id": 900 + i,
+                        "method": "tools/call",
+                        "params": {
+                            "name": "mcp__pydoll-browser__close_browser_session",
+                            "arguments": {"session_id": session_id}
+                        }
                     }
-                })
+                    for i, session_id in enumerate(sessions)
+                ])
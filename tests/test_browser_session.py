@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 class TestBrowserSession:
     """Test browser session operations."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_create_browser_session(self, mcp_client, browser_session_data):
         """Test creating a new browser session."""
         request = {
@@ -40,7 +40,7 @@ class TestBrowserSession:
                 assert content["type"] == "text"
                 assert "session" in content["text"].lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_start_browser_session(self, mcp_client):
         """Test starting a browser session."""
         # First create session
@@ -79,7 +79,7 @@ class TestBrowserSession:
             assert response["jsonrpc"] == "2.0"
             assert response["id"] == 2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_list_sessions(self, mcp_client):
         """Test listing active sessions."""
         request = {
@@ -110,7 +110,7 @@ class TestBrowserSession:
             assert isinstance(session_data["browser_sessions"], list)
             assert isinstance(session_data["tab_sessions"], list)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_session_info(self, mcp_client):
         """Test getting specific session information."""
         request = {
@@ -136,7 +136,7 @@ class TestBrowserSession:
             result = response["result"]
             assert "content" in result
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_close_browser_session(self, mcp_client):
         """Test closing a browser session."""
         # Test closing nonexistent session
@@ -158,7 +158,7 @@ class TestBrowserSession:
         # Should handle gracefully
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalid_session_parameters(self, mcp_client):
         """Test creating session with invalid parameters."""
         request = {
@@ -189,7 +189,7 @@ class TestBrowserSession:
             content_text = result["content"][0]["text"].lower()
             assert "error" in content_text or "invalid" in content_text
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_cleanup_elements(self, mcp_client):
         """Test element cleanup functionality."""
         request = {
@@ -213,7 +213,7 @@ class TestBrowserSession:
             content_text = result["content"][0]["text"]
             assert "cleaned" in content_text.lower() or "cleanup" in content_text.lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_session_lifecycle(self, mcp_client):
         """Test complete session lifecycle: create -> start -> use -> close."""
         session_id = "lifecycle-test-session"
@@ -1,14 +1,16 @@
 """
 Test element finding, interaction, and property operations.
 """
+import json
+
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, Mock
 
 
 class TestElementOperations:
     """Test element finding and interaction functionality."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_find_elements(self, mcp_client, element_selectors):
         """Test finding elements with different selector types."""
         for selector_type, selectors in element_selectors.items():
@@ -35,7 +37,7 @@ class TestElementOperations:
                 assert response["id"] == 1
                 assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_wait_for_element(self, mcp_client):
         """Test waiting for element to appear."""
         request = {
@@ -59,7 +61,21 @@ class TestElementOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_wait_for_element_observer(self, server_module, fake_tab):
+        """Test the MutationObserver wait runs as an awaited Runtime.evaluate."""
+        fake_tab.query = AsyncMock(side_effect=TimeoutError)
+        fake_tab._execute_command.return_value = {"result": {"result": {"type": "boolean", "value": True}}}
+
+        response = await server_module.wait_for_element("test-tab", "css", "#late", timeout=1)
+
+        assert response["content"][0]["text"] == "Element found with selector '#late'"
+        command = fake_tab._execute_command.await_args.args[0]
+        assert command["method"] == "Runtime.evaluate"
+        assert command["params"]["awaitPromise"] is True
+        fake_tab.query.assert_awaited_once()
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_element_text(self, mcp_client):
         """Test getting element text content."""
         request = {
@@ -78,7 +94,7 @@ class TestElementOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_element_attribute(self, mcp_client):
         """Test getting element attributes."""
         request = {
@@ -100,7 +116,7 @@ class TestElementOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_element_property(self, mcp_client):
         """Test getting element JavaScript properties."""
         request = {
@@ -122,7 +138,25 @@ class TestElementOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_element_properties_batched(self, server_module, fake_tab):
+        """Test reading one or several element properties from the script result."""
+        server_module._cache_set("test-element-id", object(), "test-tab")
+        fake_tab.execute_script.return_value = {
+            "id": 1,
+            "result": {"result": {"type": "object", "value": {"value": "abc", "disabled": False}}}
+        }
+
+        single = await server_module.get_element_property("test-element-id", property_name="value")
+        batched = await server_module.get_element_property(
+            "test-element-id", property_names=["value", "disabled"]
+        )
+
+        assert single["content"][0]["text"] == "abc"
+        assert json.loads(batched["content"][0]["text"]) == {"value": "abc", "disabled": False}
+        assert fake_tab.execute_script.await_count == 2
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_element_html(self, mcp_client):
         """Test getting element HTML content."""
         request = {
@@ -141,7 +175,54 @@ class TestElementOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_element_html_from_snapshot(self, server_module, fake_tab):
+        """Test inner and outer HTML both come from PyDoll's outerHTML snapshot."""
+        class FakeElement:
+            @property
+            async def inner_html(self):
+                return '<div class="box"><p>Hi</p></div>'
+
+        server_module._cache_set("test-element-id", FakeElement(), "test-tab")
+
+        inner = await server_module.get_element_html("test-element-id")
+        outer = await server_module.get_element_html("test-element-id", outer_html=True)
+
+        assert inner["content"][0]["text"] == "<p>Hi</p>"
+        assert outer["content"][0]["text"] == '<div class="box"><p>Hi</p></div>'
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_action_drops_cached_element_state(self, server_module, fake_tab):
+        """Test an action on a tab drops the cached state and HTML of its elements."""
+        server_module._cache_set("test-element-id", Mock(), "test-tab")
+        server_module.ELEMENT_STATE_CACHE["test-element-id"] = (0, {"visible": True})
+        server_module.ELEMENT_HTML_CACHE["test-element-id"] = (0, "<p>Hi</p>")
+
+        server_module._invalidate_page_caches("is_element_visible", {"element_id": "test-element-id"})
+        assert "test-element-id" in server_module.ELEMENT_STATE_CACHE
+
+        server_module._invalidate_page_caches("click_element", {"element_id": "test-element-id"})
+        assert "test-element-id" not in server_module.ELEMENT_STATE_CACHE
+        assert "test-element-id" not in server_module.ELEMENT_HTML_CACHE
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_frame_validation(self, server_module, fake_tab):
+        """Test iframe validation reads PyDoll's sync element properties."""
+        element = Mock()
+        element.tag_name = "IFRAME"
+        element.get_attribute.return_value = "/frame.html"
+        element.execute_script = AsyncMock()
+        fake_tab.get_frame = AsyncMock(return_value=Mock())
+        server_module._cache_set("frame-element", element, "test-tab")
+
+        response = await server_module.get_frame("frame-element", "test-frame")
+        server_module.TAB_SESSIONS.pop("test-frame", None)
+
+        assert response["content"][0]["text"] == "Frame context created as tab 'test-frame'"
+        assert element.execute_script.await_args.args[0].startswith("function(){")
+        fake_tab.get_frame.assert_awaited_once_with(element)
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_element_bounds(self, mcp_client):
         """Test getting element position and dimensions."""
         request = {
@@ -160,7 +241,7 @@ class TestElementOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_element_visibility_checks(self, mcp_client):
         """Test element visibility, enabled, and selected state checks."""
         state_checks = [
@@ -168,7 +249,8 @@ class TestElementOperations:
             "is_element_enabled", 
             "is_element_selected",
             "is_element_on_top",
-            "is_element_interactable"
+            "is_element_interactable",
+            "get_element_state"
         ]
         
         for check_method in state_checks:
@@ -188,7 +270,7 @@ class TestElementOperations:
             assert response["id"] == 1
             assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_click_element(self, mcp_client):
         """Test clicking elements."""
         # Test regular click
@@ -206,7 +288,7 @@ class TestElementOperations:
         assert response["jsonrpc"] == "2.0"
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_click_element_js(self, mcp_client):
         """Test JavaScript click on elements."""
         request = {
@@ -223,7 +305,7 @@ class TestElementOperations:
         assert response["jsonrpc"] == "2.0"
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_type_text(self, mcp_client):
         """Test typing text into elements."""
         request = {
@@ -243,7 +325,7 @@ class TestElementOperations:
         assert response["jsonrpc"] == "2.0"
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_clear_text(self, mcp_client):
         """Test clearing text from input elements."""
         request = {
@@ -260,7 +342,7 @@ class TestElementOperations:
         assert response["jsonrpc"] == "2.0"
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_hover_element(self, mcp_client):
         """Test hovering over elements."""
         request = {
@@ -277,7 +359,7 @@ class TestElementOperations:
         assert response["jsonrpc"] == "2.0"
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_scroll_element(self, mcp_client):
         """Test scrolling elements."""
         request = {
@@ -294,7 +376,7 @@ class TestElementOperations:
         assert response["jsonrpc"] == "2.0"
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalid_element_id(self, mcp_client):
         """Test operations with invalid element IDs."""
         request = {
@@ -320,7 +402,7 @@ class TestElementOperations:
             content_text = result["content"][0]["text"].lower()
             assert "error" in content_text or "not found" in content_text
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalid_selector_type(self, mcp_client):
         """Test finding elements with invalid selector type."""
         request = {
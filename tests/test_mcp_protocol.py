@@ -1,15 +1,18 @@
 """
 Test MCP protocol compliance and JSON-RPC communication.
 """
+import asyncio
+import io
 import json
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, AsyncMock
 
 
 class TestMCPProtocol:
     """Test MCP protocol implementation."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_list_tools(self, mcp_client, sample_list_tools_request):
         """Test tools/list method returns all available tools."""
         response = await mcp_client.send_request(sample_list_tools_request)
@@ -44,7 +47,7 @@ class TestMCPProtocol:
         for expected_tool in expected_tools:
             assert expected_tool in tool_names
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalid_method(self, mcp_client):
         """Test server handles invalid method gracefully."""
         request = {
@@ -61,7 +64,7 @@ class TestMCPProtocol:
         # Server may return -32601 (Method not found) or -32602 (Invalid params)
         assert response["error"]["code"] in [-32601, -32602]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_malformed_request(self, mcp_client):
         """Test server handles malformed requests."""
         # Missing required fields
@@ -82,7 +85,7 @@ class TestMCPProtocol:
             # as long as it's a reasonable error response
             assert "timeout" in str(e).lower() or "connection" in str(e).lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_tool_schema_validation(self, mcp_client, sample_list_tools_request):
         """Test that tool schemas are properly defined."""
         response = await mcp_client.send_request(sample_list_tools_request)
@@ -116,7 +119,7 @@ class TestMCPProtocol:
         assert "id" in sample_tool_request
         assert "method" in sample_tool_request
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_error_response_format(self, mcp_client):
         """Test error responses follow JSON-RPC format."""
         request = {
@@ -141,7 +144,7 @@ class TestMCPProtocol:
         assert isinstance(error["code"], int)
         assert isinstance(error["message"], str)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_concurrent_requests(self, mcp_client):
         """Test server handles concurrent requests properly."""
         # Send requests sequentially to avoid client concurrency issues
@@ -163,4 +166,58 @@ class TestMCPProtocol:
         for i, response in enumerate(responses):
             assert response["jsonrpc"] == "2.0"
             assert response["id"] == i
-            assert "result" in response or "error" in response
\ No newline at end of file
+            assert "result" in response or "error" in response
+
+
+class TestRequestOrdering:
+    """Test how the server orders requests it runs concurrently."""
+
+    def test_request_order_keys(self, server_module, fake_tab):
+        """Test requests are ordered by the tabs and sessions they act on."""
+        def call(**arguments):
+            return {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+                    "params": {"name": "any_tool", "arguments": arguments}}
+
+        server_module._cache_set("owned-element", object(), "test-tab")
+
+        assert server_module._request_order_keys(call(browser_session_id="s1", tab_id="t1")) == {"s1", "t1"}
+        assert server_module._request_order_keys(call(element_id="owned-element")) == {"test-tab"}
+        assert server_module._request_order_keys(call(element_id="pending-element")) is None
+        assert server_module._request_order_keys(call()) is None
+        assert server_module._request_order_keys({"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {
+            "name": "close_browser_session", "arguments": {"browser_session_id": "s1"}}}) is None
+        assert server_module._request_order_keys({"jsonrpc": "2.0", "id": 2, "method": "tools/list"}) == set()
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_earlier_tab_request(self, server_module, monkeypatch):
+        """Test a session close waits for a slower request sent before it."""
+        events = []
+
+        async def read_title(tab_id):
+            events.append("read started")
+            await asyncio.sleep(0.05)
+            events.append("read finished")
+            return server_module.create_success_response("Title")
+
+        async def close_session(browser_session_id):
+            events.append("close")
+            return server_module.create_success_response("Closed")
+
+        monkeypatch.setitem(server_module.TOOL_HANDLERS, "get_page_title", read_title)
+        monkeypatch.setitem(server_module.TOOL_HANDLERS, "close_browser_session", close_session)
+        requests = [
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+             "params": {"name": "get_page_title", "arguments": {"tab_id": "t1"}}},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/call",
+             "params": {"name": "close_browser_session", "arguments": {"browser_session_id": "s1"}}},
+        ]
+        stdout = SimpleNamespace(buffer=io.BytesIO())
+        monkeypatch.setattr(server_module.sys, "stdin", SimpleNamespace(
+            buffer=io.BytesIO(b"".join(json.dumps(request).encode() + b"\n" for request in requests))))
+        monkeypatch.setattr(server_module.sys, "stdout", stdout)
+
+        await server_module.main_async()
+
+        assert events == ["read started", "read finished", "close"]
+        responses = [json.loads(line) for line in stdout.buffer.getvalue().splitlines()]
+        assert [response["id"] for response in responses] == [1, 2]
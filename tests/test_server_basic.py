@@ -8,7 +8,7 @@ import pytest
 class TestServerBasic:
     """Test basic server functionality."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_server_connectivity(self, mcp_client):
         """Test that the MCP server can be reached and responds."""
         request = {
@@ -35,7 +35,7 @@ class TestServerBasic:
         tool_names = [tool["name"] for tool in response["result"]["tools"]]
         assert any("browser" in name for name in tool_names)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalid_method(self, mcp_client):
         """Test server handles invalid methods gracefully."""
         request = {
@@ -52,7 +52,7 @@ class TestServerBasic:
         # Server may return -32601 (Method not found) or -32602 (Invalid params)
         assert response["error"]["code"] in [-32601, -32602]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_malformed_request(self, mcp_client):
         """Test server handles malformed requests."""
         request = {
@@ -71,7 +71,7 @@ class TestServerBasic:
             # If server times out on malformed request, that's acceptable
             assert "timeout" in str(e).lower() or "connection" in str(e).lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_list_sessions_empty(self, mcp_client):
         """Test listing sessions when none exist."""
         request = {
@@ -101,7 +101,7 @@ class TestServerBasic:
             assert isinstance(session_data["browser_sessions"], list)
             assert isinstance(session_data["tab_sessions"], list)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_cleanup_elements_empty(self, mcp_client):
         """Test cleanup when no elements exist."""
         request = {
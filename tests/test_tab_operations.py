@@ -1,14 +1,16 @@
 """
 Test tab management and navigation functionality.
 """
+import json
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, AsyncMock
 
 
 class TestTabOperations:
     """Test tab creation, navigation, and management."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_create_tab(self, mcp_client):
         """Test creating a new tab."""
         request = {
@@ -33,7 +35,7 @@ class TestTabOperations:
         # Should handle gracefully even if session doesn't exist
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_navigate(self, mcp_client):
         """Test navigation to URL."""
         request = {
@@ -56,7 +58,7 @@ class TestTabOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_page_url(self, mcp_client):
         """Test getting current page URL."""
         request = {
@@ -75,7 +77,7 @@ class TestTabOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_page_title(self, mcp_client):
         """Test getting page title."""
         request = {
@@ -94,7 +96,7 @@ class TestTabOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_page_source(self, mcp_client, test_html_content):
         """Test getting page source."""
         request = {
@@ -120,7 +122,7 @@ class TestTabOperations:
             # Should return some HTML content or error message
             assert isinstance(content_text, str)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_go_back_forward(self, mcp_client):
         """Test browser back/forward navigation."""
         back_request = {
@@ -151,7 +153,7 @@ class TestTabOperations:
         assert forward_response["jsonrpc"] == "2.0"
         assert forward_response["id"] == 2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_refresh_page(self, mcp_client):
         """Test page refresh functionality."""
         request = {
@@ -173,7 +175,7 @@ class TestTabOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_close_tab(self, mcp_client):
         """Test closing a tab."""
         request = {
@@ -192,7 +194,7 @@ class TestTabOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_bring_tab_to_front(self, mcp_client):
         """Test bringing tab to front."""
         request = {
@@ -211,7 +213,7 @@ class TestTabOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_wait_for_page_load(self, mcp_client):
         """Test waiting for page load."""
         request = {
@@ -233,7 +235,76 @@ class TestTabOperations:
         assert response["id"] == 1
         assert "result" in response or "error" in response
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_navigate_skips_loaded_url(self, server_module, fake_tab):
+        """Test navigating to the URL a tab already shows does not reload it."""
+        async def current_url():
+            return "http://localhost:8000/"
+
+        type(fake_tab).current_url = property(lambda tab: current_url())
+        fake_tab.go_to = AsyncMock()
+
+        response = await server_module.navigate("test-tab", "http://localhost:8000/")
+
+        assert response["content"][0]["text"] == "Already at http://localhost:8000/, navigation skipped"
+        fake_tab.go_to.assert_not_awaited()
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_wait_for_function_in_page(self, server_module, fake_tab):
+        """Test wait_for_function waits inside the page instead of polling from Python."""
+        fake_tab._execute_command.return_value = {"result": {"result": {"type": "object", "value": {"value": 42}}}}
+
+        response = await server_module.wait_for_function("test-tab", "window.ready", timeout=1)
+
+        assert response["content"][0]["text"] == "Function returned truthy value: 42"
+        command = fake_tab._execute_command.await_args.args[0]
+        assert command["method"] == "Runtime.evaluate"
+        assert command["params"]["awaitPromise"] is True
+        assert command["params"]["returnByValue"] is True
+        # execute_script is only used by the Python polling fallback
+        fake_tab.execute_script.assert_not_awaited()
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_wait_for_function_wraps_expressions(self, server_module, fake_tab):
+        """Test an expression that merely mentions 'return' is still wrapped as a return value."""
+        fake_tab._execute_command.return_value = {"result": {"result": {"type": "object", "value": {"value": True}}}}
+
+        await server_module.wait_for_function("test-tab", "document.querySelector('.return-btn')", timeout=1)
+
+        expression = fake_tab._execute_command.await_args.args[0]["params"]["expression"]
+        assert "return (document.querySelector('.return-btn'));" in expression
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_event_filter_keeps_events_without_url(self, server_module, fake_tab):
+        """Test an event callback's URL filter only drops events whose URL doesn't match."""
+        fake_tab.on = AsyncMock(return_value=1)
+
+        await server_module.register_event_callback("test-tab", "logs", "Network.requestWillBeSent", "*.json")
+        callback = fake_tab.on.await_args.args[1]
+        callback({"params": {"request": {"url": "http://localhost:8000/data.json"}}})
+        callback({"params": {"request": {"url": "http://localhost:8000/style.css"}}})
+        callback({"params": {"message": "no url"}})
+
+        logged = [entry["data"] for entry in server_module.EVENT_LOGS.pop("test-tab")]
+        server_module.EVENT_CALLBACKS.pop("test-tab", None)
+        assert logged == [
+            {"params": {"request": {"url": "http://localhost:8000/data.json"}}},
+            {"params": {"message": "no url"}},
+        ]
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_download_files_names_duplicates_apart(self, server_module, fake_tab, tmp_path):
+        """Test URLs ending in the same filename are saved to separate files."""
+        fake_tab.request.get = AsyncMock(return_value=SimpleNamespace(content=b"data"))
+        urls = ["http://a.test/report.pdf", "http://b.test/report.pdf", "http://c.test/report.pdf"]
+
+        response = await server_module.download_files("test-tab", urls, directory=str(tmp_path))
+
+        results = json.loads(response["content"][0]["text"])
+        assert [result["url"] for result in results] == urls
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["report-1.pdf", "report-2.pdf", "report.pdf"]
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalid_tab_id(self, mcp_client):
         """Test operations with invalid tab ID."""
         request = {
@@ -262,7 +333,7 @@ class TestTabOperations:
             content_text = result["content"][0]["text"].lower()
             assert "error" in content_text or "not found" in content_text
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalid_url_navigation(self, mcp_client):
         """Test navigation with invalid URL."""
         request = {